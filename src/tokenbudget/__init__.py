@@ -12,7 +12,15 @@ from .exceptions import (
     TokenBudgetError,
     TokenLimitReached,
 )
-from .pricing import calculate_cost, get_price, list_models, refresh_pricing, register_model, ModelPrice
+from .pricing import (
+    ModelPrice,
+    calculate_cost,
+    calculate_cost_batch,
+    get_price,
+    list_models,
+    refresh_pricing,
+    register_model,
+)
 from .reports import export_csv, export_json, generate_table_report
 from .tracker import CacheStats, TokenTracker, Usage
 
@@ -32,6 +40,7 @@ __all__ = [
     "register_model",
     "list_models",
     "calculate_cost",
+    "calculate_cost_batch",
     "ModelPrice",
     "refresh_pricing",
     # Reports
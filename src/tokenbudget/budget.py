@@ -13,6 +13,35 @@ _budget_context: ContextVar[Optional["BudgetContext"]] = ContextVar(
     "_budget_context", default=None
 )
 
+# Fast path for plain synchronous scripts: budgets entered on the main
+# thread with no running asyncio event loop are kept on a simple stack,
+# which is cheaper than ContextVar set/reset. Async and worker-thread
+# code still goes through the ContextVar for correct propagation.
+_SYNC_FAST_PATH = True
+_sync_stack: list["BudgetContext"] = []
+
+# Count of currently entered BudgetContexts across all threads/tasks. Lets
+# per-response code skip the ContextVar lookup entirely when no budget is
+# active anywhere, which is the common untracked case. Updates happen under
+# a lock — an unlocked += can lose an increment between threads and leave
+# budget_active() stuck at False — while the hot read stays lock-free (a
+# torn read is impossible for a single int, and enter/exit are cold).
+_active_count = 0
+_active_count_lock = threading.Lock()
+
+
+def budget_active() -> bool:
+    """Report whether any budget context is currently entered.
+
+    Cheaper than get_current_budget() when the answer is usually no: a
+    single module-global int comparison instead of a ContextVar lookup.
+
+    Returns:
+        True if at least one BudgetContext is active in the process.
+    """
+    return _active_count > 0
+
+
 F = TypeVar("F", bound=Callable[..., Any])
 
 
@@ -22,6 +51,19 @@ class BudgetContext:
     Tracks usage within a budget and raises exceptions when limits are exceeded.
     """
 
+    __slots__ = (
+        "max_cost_usd",
+        "max_tokens",
+        "tracker",
+        "_initial_cost",
+        "_initial_tokens",
+        "_initial_prompt_tokens",
+        "_initial_completion_tokens",
+        "_initial_calls",
+        "_token",
+        "_prev_active",
+    )
+
     def __init__(
         self,
         max_cost_usd: Optional[float] = None,
@@ -38,37 +80,44 @@ class BudgetContext:
         self.max_cost_usd = max_cost_usd
         self.max_tokens = max_tokens
         self.tracker = tracker or TokenTracker()
-        self._initial_usage = self.tracker.usage
-        self._lock = threading.Lock()
+        # Snapshot the starting point as plain scalars rather than holding a
+        # Usage object: the deltas only ever need field-wise subtraction.
+        initial = self.tracker.usage
+        self._initial_cost = initial.total_cost_usd
+        self._initial_tokens = initial.total_tokens
+        self._initial_prompt_tokens = initial.prompt_tokens
+        self._initial_completion_tokens = initial.completion_tokens
+        self._initial_calls = initial.calls
 
     @property
     def current_usage(self) -> Usage:
         """Get current usage within this budget context."""
-        with self._lock:
-            current = self.tracker.usage
-            # Calculate delta from initial usage
-            return Usage(
-                total_tokens=current.total_tokens - self._initial_usage.total_tokens,
-                prompt_tokens=current.prompt_tokens - self._initial_usage.prompt_tokens,
-                completion_tokens=current.completion_tokens
-                - self._initial_usage.completion_tokens,
-                total_cost_usd=current.total_cost_usd - self._initial_usage.total_cost_usd,
-                calls=current.calls - self._initial_usage.calls,
-            )
+        # tracker.usage returns an internally consistent copy taken under the
+        # tracker's own lock, so the delta needs no synchronization here.
+        current = self.tracker.usage
+        return Usage(
+            total_tokens=current.total_tokens - self._initial_tokens,
+            prompt_tokens=current.prompt_tokens - self._initial_prompt_tokens,
+            completion_tokens=current.completion_tokens - self._initial_completion_tokens,
+            total_cost_usd=current.total_cost_usd - self._initial_cost,
+            calls=current.calls - self._initial_calls,
+        )
 
     @property
     def remaining_budget(self) -> Optional[float]:
         """Get remaining budget in USD."""
         if self.max_cost_usd is None:
             return None
-        return max(0.0, self.max_cost_usd - self.current_usage.total_cost_usd)
+        spent = self.tracker.usage.total_cost_usd - self._initial_cost
+        return max(0.0, self.max_cost_usd - spent)
 
     @property
     def remaining_tokens(self) -> Optional[int]:
         """Get remaining token budget."""
         if self.max_tokens is None:
             return None
-        return max(0, self.max_tokens - self.current_usage.total_tokens)
+        used = self.tracker.usage.total_tokens - self._initial_tokens
+        return max(0, self.max_tokens - used)
 
     def check_limits(self) -> None:
         """Check if budget limits have been exceeded.
@@ -77,47 +126,102 @@ class BudgetContext:
             BudgetExceeded: If cost limit is exceeded.
             TokenLimitReached: If token limit is exceeded.
         """
-        usage = self.current_usage
-
-        if self.max_cost_usd is not None and usage.total_cost_usd > self.max_cost_usd:
-            raise BudgetExceeded(
-                f"Budget exceeded: ${usage.total_cost_usd:.4f} > ${self.max_cost_usd:.4f}",
-                current_cost=usage.total_cost_usd,
-                max_cost=self.max_cost_usd,
-            )
-
-        if self.max_tokens is not None and usage.total_tokens > self.max_tokens:
-            raise TokenLimitReached(
-                f"Token limit exceeded: {usage.total_tokens} > {self.max_tokens}",
-                current_tokens=usage.total_tokens,
-                max_tokens=self.max_tokens,
-            )
+        # Fast path: nothing to enforce (the plain "just track" case).
+        if self.max_cost_usd is None and self.max_tokens is None:
+            return
+
+        # Read the tracker snapshot once and compare scalar deltas directly;
+        # this runs after every tracked call, so avoid building a Usage here.
+        usage = self.tracker.usage
+
+        if self.max_cost_usd is not None:
+            current_cost = usage.total_cost_usd - self._initial_cost
+            if current_cost > self.max_cost_usd:
+                raise BudgetExceeded(
+                    f"Budget exceeded: ${current_cost:.4f} > ${self.max_cost_usd:.4f}",
+                    current_cost=current_cost,
+                    max_cost=self.max_cost_usd,
+                )
+
+        if self.max_tokens is not None:
+            current_tokens = usage.total_tokens - self._initial_tokens
+            if current_tokens > self.max_tokens:
+                raise TokenLimitReached(
+                    f"Token limit exceeded: {current_tokens} > {self.max_tokens}",
+                    current_tokens=current_tokens,
+                    max_tokens=self.max_tokens,
+                )
 
     def __enter__(self) -> "BudgetContext":
         """Enter the budget context."""
-        _budget_context.set(self)
+        global _active_count
+        with _active_count_lock:
+            _active_count += 1
+        # Bind this context on its tracker so wrappers sharing the tracker
+        # can reach it with one attribute read instead of a ContextVar
+        # lookup; the previous binding is restored on exit for nesting.
+        tracker = self.tracker
+        self._prev_active = tracker._active_budget
+        tracker._active_budget = self
+        if _SYNC_FAST_PATH and threading.current_thread() is threading.main_thread():
+            # Imported here, not at module scope, so importing tokenbudget
+            # never pulls in asyncio; after the first call this is a
+            # sys.modules lookup.
+            from asyncio import get_running_loop
+
+            try:
+                get_running_loop()
+            except RuntimeError:
+                # Synchronous main-thread code: a list push beats ContextVar.
+                _sync_stack.append(self)
+                self._token = None
+                return self
+        self._token = _budget_context.set(self)
         return self
 
     def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
         """Exit the budget context."""
-        _budget_context.set(None)
+        global _active_count
+        with _active_count_lock:
+            _active_count -= 1
+        self.tracker._active_budget = self._prev_active
+        # Restore the previous budget context (supports nested budgets).
+        token = self._token
+        if token is None:
+            _sync_stack.pop()
+        else:
+            _budget_context.reset(token)
         # Check limits when exiting context (if no exception occurred)
         if exc_type is None:
             self.check_limits()
 
 
-def get_current_budget() -> Optional[BudgetContext]:
+def get_current_budget(
+    _get: Callable[[], Optional[BudgetContext]] = _budget_context.get,
+) -> Optional[BudgetContext]:
     """Get the current budget context.
 
     Returns:
         Current BudgetContext or None if not in a budget context.
     """
-    return _budget_context.get()
+    # _get is pre-bound at definition time so the hot lookup is a single
+    # LOAD_FAST instead of a module attribute chain; not a public parameter.
+    # The ContextVar is consulted first: a budget entered inside a running
+    # event loop (or worker thread) is nested inside any main-thread sync
+    # budgets on the stack, and the innermost active budget must win.
+    ctx = _get()
+    if ctx is not None:
+        return ctx
+    if _sync_stack and threading.current_thread() is threading.main_thread():
+        return _sync_stack[-1]
+    return None
 
 
 class _BudgetDecorator:
     """Helper class to make budget work as both decorator and context manager."""
 
+    __slots__ = ("max_cost_usd", "max_tokens", "tracker", "_context")
+
     def __init__(
         self,
         max_cost_usd: Optional[float] = None,
@@ -132,6 +236,11 @@ class _BudgetDecorator:
 
     def __call__(self, func: F) -> F:
         """Use as decorator."""
+        # With no limits and no tracker there is nothing to enforce or
+        # record: hand the original function back so decorated call sites
+        # pay no extra frame or context manager at all.
+        if self.max_cost_usd is None and self.max_tokens is None and self.tracker is None:
+            return func
 
         @functools.wraps(func)
         def wrapper(*args: Any, **kwargs: Any) -> Any:
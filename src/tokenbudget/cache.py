@@ -1,21 +1,77 @@
 """Response caching for tokenbudget."""
 
+import base64
+import copy
 import json
 import os
 import pickle
+import sqlite3
 import tempfile
+import threading
 from abc import ABC, abstractmethod
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, Optional
-
-from .utils import hash_request
+from typing import Any, Optional, Union
+
+from .exceptions import CacheError
+from .utils import _canonical_dumps, _digest, hash_request
+
+# Keys produced by make_key() are raw digest bytes; plain strings are still
+# accepted for callers that build their own keys.
+CacheKey = Union[str, bytes]
+
+# Memo of per-message digests keyed by id(). Conversations grow by
+# appending turns, so earlier message dicts are re-serialized on every
+# call without this. Each entry stores a deep snapshot of the message it
+# was computed from and is only reused when the live message still
+# compares equal to it, so in-place edits (and recycled ids) fall back
+# to recomputation instead of serving a stale digest.
+_MSG_DIGESTS: dict[int, "tuple[Any, bytes]"] = {}
+_MSG_DIGESTS_MAX = 4096
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+# Single-byte header so each cache file records how it was serialized.
+_MSGPACK_TAG = b"m"
+_PICKLE_TAG = b"p"
+
+# Shared executor for write-behind cache population. Created lazily so
+# importing the package never spawns threads.
+_write_executor: Optional["ThreadPoolExecutor"] = None
+_write_executor_lock = threading.Lock()
+
+
+def set_in_background(cache: "Cache", key: CacheKey, value: Any) -> None:
+    """Store a value in a cache without blocking the caller.
+
+    Serialization and disk writes run on a small shared thread pool so
+    the response path returns immediately; pending writes are flushed
+    before interpreter exit.
+
+    Args:
+        cache: Cache to write to.
+        key: Cache key.
+        value: Value to cache.
+    """
+    global _write_executor
+    if _write_executor is None:
+        with _write_executor_lock:
+            if _write_executor is None:
+                _write_executor = ThreadPoolExecutor(
+                    max_workers=2, thread_name_prefix="tokenbudget-cache"
+                )
+    _write_executor.submit(cache.set, key, value)
 
 
 class Cache(ABC):
     """Abstract base class for cache implementations."""
 
     @abstractmethod
-    def get(self, key: str) -> Optional[Any]:
+    def get(self, key: CacheKey) -> Optional[Any]:
         """Get a value from the cache.
 
         Args:
@@ -27,7 +83,7 @@ class Cache(ABC):
         pass
 
     @abstractmethod
-    def set(self, key: str, value: Any) -> None:
+    def set(self, key: CacheKey, value: Any) -> None:
         """Set a value in the cache.
 
         Args:
@@ -41,16 +97,47 @@ class Cache(ABC):
         """Clear all cached values."""
         pass
 
-    def make_key(self, request: Dict[str, Any]) -> str:
+    def make_key(self, request: dict[str, Any]) -> bytes:
         """Generate a cache key from a request.
 
+        The raw digest bytes are used directly; hex-encoding them would
+        only double the key length and add an encode step per lookup.
+
+        The messages list — typically the largest field — is hashed one
+        message at a time with the digests memoized per message object
+        and validated against a content snapshot before reuse, so a
+        growing conversation only serializes its new turns while mutated
+        messages are re-hashed; the per-message digests and the digest of
+        the remaining kwargs are then folded into the final key. The
+        result depends only on content, not on memo state.
+
         Args:
             request: Request dictionary.
 
         Returns:
-            Cache key string.
+            Cache key bytes.
         """
-        return hash_request(request)
+        messages = request.get("messages")
+        if type(messages) is not list or not messages:
+            return hash_request(request)
+
+        digests = []
+        for msg in messages:
+            entry = _MSG_DIGESTS.get(id(msg))
+            # The equality check (a C-level compare, cheaper than
+            # serialize-plus-hash) guards against both in-place mutation
+            # and id reuse after the original message was collected.
+            if entry is not None and entry[0] == msg:
+                digest = entry[1]
+            else:
+                digest = _digest(_canonical_dumps(msg))
+                if len(_MSG_DIGESTS) >= _MSG_DIGESTS_MAX:
+                    _MSG_DIGESTS.clear()
+                _MSG_DIGESTS[id(msg)] = (copy.deepcopy(msg), digest)
+            digests.append(digest)
+
+        rest = {k: v for k, v in request.items() if k != "messages"}
+        return _digest(_canonical_dumps(rest) + b"".join(digests))
 
 
 class MemoryCache(Cache):
@@ -58,9 +145,9 @@ class MemoryCache(Cache):
 
     def __init__(self) -> None:
         """Initialize the memory cache."""
-        self._cache: Dict[str, Any] = {}
+        self._cache: dict[CacheKey, Any] = {}
 
-    def get(self, key: str) -> Optional[Any]:
+    def get(self, key: CacheKey) -> Optional[Any]:
         """Get a value from the cache.
 
         Args:
@@ -71,7 +158,7 @@ class MemoryCache(Cache):
         """
         return self._cache.get(key)
 
-    def set(self, key: str, value: Any) -> None:
+    def set(self, key: CacheKey, value: Any) -> None:
         """Set a value in the cache.
 
         Args:
@@ -88,19 +175,70 @@ class MemoryCache(Cache):
 class DiskCache(Cache):
     """Disk-based cache implementation."""
 
-    def __init__(self, cache_dir: Optional[str] = None) -> None:
+    def __init__(self, cache_dir: Optional[str] = None, serializer: str = "auto") -> None:
         """Initialize the disk cache.
 
         Args:
             cache_dir: Directory to store cache files. Default: system temp dir.
+            serializer: Serialization format ("auto", "msgpack", "pickle").
+                "auto" uses msgpack when installed and the value is
+                msgpack-serializable, falling back to pickle otherwise.
+
+        Raises:
+            CacheError: If serializer is "msgpack" but msgpack is not installed.
         """
         if cache_dir is None:
             cache_dir = os.path.join(tempfile.gettempdir(), "tokenbudget_cache")
 
+        if serializer not in ("auto", "msgpack", "pickle"):
+            raise ValueError(
+                f"Unknown serializer: {serializer}. Use 'auto', 'msgpack' or 'pickle'."
+            )
+        if serializer == "msgpack" and msgpack is None:
+            raise CacheError("msgpack support requires: pip install tokenbudget[cache]")
+        self._use_msgpack = serializer != "pickle" and msgpack is not None
+
         self._cache_dir = Path(cache_dir)
         self._cache_dir.mkdir(parents=True, exist_ok=True)
 
-    def _get_path(self, key: str) -> Path:
+    def _serialize(self, value: Any) -> bytes:
+        """Serialize a value to tagged bytes.
+
+        Args:
+            value: Value to serialize.
+
+        Returns:
+            Serialized bytes prefixed with a one-byte format tag.
+        """
+        if self._use_msgpack:
+            try:
+                return _MSGPACK_TAG + bytes(msgpack.packb(value, use_bin_type=True))
+            except (TypeError, ValueError):
+                # Not msgpack-serializable (e.g. SDK response objects).
+                pass
+        return _PICKLE_TAG + pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+
+    @staticmethod
+    def _deserialize(data: bytes) -> Any:
+        """Deserialize tagged bytes back into a value.
+
+        Args:
+            data: Serialized bytes with a one-byte format tag.
+
+        Returns:
+            The deserialized value.
+        """
+        tag = data[:1]
+        if tag == _MSGPACK_TAG:
+            if msgpack is None:
+                raise CacheError("Cache entry requires: pip install tokenbudget[cache]")
+            return msgpack.unpackb(data[1:], raw=False)
+        if tag == _PICKLE_TAG:
+            return pickle.loads(data[1:])
+        # Untagged file from an older cache layout.
+        return pickle.loads(data)
+
+    def _get_path(self, key: CacheKey) -> Path:
         """Get the file path for a cache key.
 
         Args:
@@ -109,9 +247,11 @@ class DiskCache(Cache):
         Returns:
             Path to cache file.
         """
+        if isinstance(key, bytes):
+            key = base64.urlsafe_b64encode(key).decode("ascii").rstrip("=")
         return self._cache_dir / f"{key}.pkl"
 
-    def get(self, key: str) -> Optional[Any]:
+    def get(self, key: CacheKey) -> Optional[Any]:
         """Get a value from the cache.
 
         Args:
@@ -120,17 +260,16 @@ class DiskCache(Cache):
         Returns:
             Cached value or None if not found.
         """
-        path = self._get_path(key)
-        if not path.exists():
-            return None
-
+        # Read directly and treat a missing file as a miss: one syscall
+        # chain instead of a separate exists() stat before every open.
         try:
-            with open(path, "rb") as f:
-                return pickle.load(f)
+            return self._deserialize(self._get_path(key).read_bytes())
+        except FileNotFoundError:
+            return None
         except Exception:
             return None
 
-    def set(self, key: str, value: Any) -> None:
+    def set(self, key: CacheKey, value: Any) -> None:
         """Set a value in the cache.
 
         Args:
@@ -138,16 +277,190 @@ class DiskCache(Cache):
             value: Value to cache.
         """
         path = self._get_path(key)
+        tmp_path = None
         try:
-            with open(path, "wb") as f:
-                pickle.dump(value, f)
+            # Write to a temp file in the same directory and rename into
+            # place so readers never observe a partially written entry.
+            data = self._serialize(value)
+            with tempfile.NamedTemporaryFile(
+                dir=self._cache_dir, prefix=".tmp-", delete=False
+            ) as f:
+                tmp_path = f.name
+                f.write(data)
+            os.replace(tmp_path, path)
         except Exception:
-            pass
+            # Best-effort cache: swallow the failure, but don't leave the
+            # orphaned temp file behind.
+            if tmp_path is not None:
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
 
     def clear(self) -> None:
         """Clear all cached values."""
-        for file in self._cache_dir.glob("*.pkl"):
+        # os.scandir yields names without the per-entry stat that
+        # pathlib.glob performs, so clearing a large cache is one
+        # directory read plus the unlinks. Temp files from interrupted
+        # writes are swept alongside the entries.
+        try:
+            with os.scandir(self._cache_dir) as entries:
+                paths = [
+                    e.path
+                    for e in entries
+                    if e.name.endswith(".pkl") or e.name.startswith(".tmp-")
+                ]
+        except OSError:
+            return
+        for path in paths:
             try:
-                file.unlink()
-            except Exception:
+                os.unlink(path)
+            except OSError:
                 pass
+
+
+class SQLiteCache(Cache):
+    """Single-file cache backed by SQLite in WAL mode.
+
+    Collapses DiskCache's one-file-per-key layout into one B-tree
+    database: a lookup is an index probe instead of a path build plus
+    open/read/close syscalls per entry, and WAL keeps readers from
+    blocking on writers.
+    """
+
+    def __init__(self, db_path: Optional[str] = None) -> None:
+        """Initialize the SQLite cache.
+
+        Args:
+            db_path: Path to the database file. Default: system temp dir.
+        """
+        if db_path is None:
+            db_path = os.path.join(tempfile.gettempdir(), "tokenbudget_cache.db")
+
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._lock = threading.Lock()
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS cache (key BLOB PRIMARY KEY, value BLOB NOT NULL)"
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def _key_bytes(key: CacheKey) -> bytes:
+        """Normalize a cache key to bytes for the BLOB primary key.
+
+        Args:
+            key: Cache key.
+
+        Returns:
+            Key as bytes.
+        """
+        return key if isinstance(key, bytes) else key.encode()
+
+    def get(self, key: CacheKey) -> Optional[Any]:
+        """Get a value from the cache.
+
+        Args:
+            key: Cache key.
+
+        Returns:
+            Cached value or None if not found.
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value FROM cache WHERE key = ?", (self._key_bytes(key),)
+            ).fetchone()
+        if row is None:
+            return None
+        try:
+            return pickle.loads(row[0])
+        except Exception:
+            return None
+
+    def set(self, key: CacheKey, value: Any) -> None:
+        """Set a value in the cache.
+
+        Args:
+            key: Cache key.
+            value: Value to cache.
+        """
+        try:
+            data = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception:
+            return
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO cache (key, value) VALUES (?, ?)",
+                (self._key_bytes(key), data),
+            )
+            self._conn.commit()
+
+    def clear(self) -> None:
+        """Clear all cached values."""
+        with self._lock:
+            self._conn.execute("DELETE FROM cache")
+            self._conn.commit()
+
+
+class TieredCache(Cache):
+    """Bounded in-memory LRU layer in front of a slower backend cache.
+
+    Hot keys are served from memory without re-reading (and
+    re-deserializing) the backend entry; misses fall through to the
+    backend and populate the LRU on the way back.
+    """
+
+    def __init__(self, backend: Cache, max_entries: int = 1024) -> None:
+        """Initialize the tiered cache.
+
+        Args:
+            backend: Slower cache to layer over (typically a DiskCache).
+            max_entries: Maximum number of entries kept in memory.
+        """
+        self._backend = backend
+        self._max_entries = max_entries
+        self._lru: OrderedDict[CacheKey, Any] = OrderedDict()
+        self._lock = threading.RLock()
+
+    def get(self, key: CacheKey) -> Optional[Any]:
+        """Get a value, preferring the in-memory layer.
+
+        Args:
+            key: Cache key.
+
+        Returns:
+            Cached value or None if not found.
+        """
+        with self._lock:
+            if key in self._lru:
+                self._lru.move_to_end(key)
+                return self._lru[key]
+
+        value = self._backend.get(key)
+        if value is not None:
+            with self._lock:
+                self._lru[key] = value
+                if len(self._lru) > self._max_entries:
+                    self._lru.popitem(last=False)
+        return value
+
+    def set(self, key: CacheKey, value: Any) -> None:
+        """Set a value, writing through to the backend.
+
+        Args:
+            key: Cache key.
+            value: Value to cache.
+        """
+        with self._lock:
+            self._lru[key] = value
+            self._lru.move_to_end(key)
+            if len(self._lru) > self._max_entries:
+                self._lru.popitem(last=False)
+        self._backend.set(key, value)
+
+    def clear(self) -> None:
+        """Clear both the in-memory layer and the backend."""
+        with self._lock:
+            self._lru.clear()
+        self._backend.clear()
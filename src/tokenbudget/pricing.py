@@ -4,34 +4,77 @@ Pricing is resolved in three tiers (highest priority first):
 1. User-registered models via ``register_model()``
 2. LiteLLM community-maintained pricing (fetched via ``refresh_pricing()``)
 3. Hardcoded fallback pricing shipped with the package
+
+A packaged LiteLLM snapshot serves as a last resort for models missing
+from all three tiers, so offline environments get broader coverage
+without a refresh_pricing() network round-trip.
 """
 
 import logging
-from dataclasses import dataclass
-from typing import Dict, Optional
+import sys
+from collections import ChainMap, defaultdict
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Optional
 
 from .exceptions import ModelNotFoundError
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(frozen=True)
 class ModelPrice:
     """Pricing information for a specific model.
 
+    Immutable; a LiteLLM refresh can load hundreds of instances, so the
+    explicit __slots__ keeps each one to a fixed slot table instead of a
+    per-instance dict. (dataclass(slots=True) needs Python 3.10+.)
+
     Attributes:
         input_per_1k: Cost per 1000 input tokens in USD.
         output_per_1k: Cost per 1000 output tokens in USD.
         provider: Provider name (e.g., "openai", "anthropic").
     """
 
+    __slots__ = (
+        "input_per_1k",
+        "output_per_1k",
+        "provider",
+        "_input_per_token",
+        "_output_per_token",
+    )
+
     input_per_1k: float
     output_per_1k: float
     provider: str
 
+    if TYPE_CHECKING:
+        # Derived attributes set in __post_init__. Declared for type
+        # checkers only: at runtime a field() class attribute would
+        # collide with the manual __slots__ entry of the same name.
+        _input_per_token: float = field(init=False, repr=False, compare=False)
+        _output_per_token: float = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Per-token rates derived once at construction so cost calculation
+        # is two multiplies and an add, with no division on the hot path.
+        # object.__setattr__ because the dataclass is frozen.
+        object.__setattr__(self, "_input_per_token", self.input_per_1k / 1000.0)
+        object.__setattr__(self, "_output_per_token", self.output_per_1k / 1000.0)
+
+    def __reduce__(self) -> "tuple[type, tuple[float, float, str]]":
+        # The default slot-based __setstate__ assigns through the frozen
+        # __setattr__ and raises FrozenInstanceError, breaking pickle and
+        # the copy module. Rebuilding from the constructor args restores
+        # both and re-derives the per-token rates in __post_init__.
+        return (ModelPrice, (self.input_per_1k, self.output_per_1k, self.provider))
+
 
 # Pricing database (as of February 2026)
-_PRICING_DB: Dict[str, ModelPrice] = {
+_PRICING_DB: dict[str, ModelPrice] = {
     # OpenAI models
     "gpt-4o": ModelPrice(input_per_1k=0.0025, output_per_1k=0.010, provider="openai"),
     "gpt-4o-mini": ModelPrice(input_per_1k=0.00015, output_per_1k=0.0006, provider="openai"),
@@ -73,20 +116,82 @@ _PRICING_DB: Dict[str, ModelPrice] = {
     ),
 }
 
+# Read-only view of the hardcoded tier. Nothing should mutate shipped
+# pricing at runtime (overrides go through register_model), and the proxy
+# enforces that without copying the dict.
+_PRICING_VIEW: "MappingProxyType[str, ModelPrice]" = MappingProxyType(_PRICING_DB)
+
+# Monotonic counter bumped whenever a pricing tier changes. Callers that
+# hold their own resolved-price caches (e.g. TokenTracker) compare it to
+# detect staleness with a single int check instead of subscribing to
+# invalidation callbacks.
+_price_version = 0
+
 # User-registered models (highest priority)
-_CUSTOM_DB: Dict[str, ModelPrice] = {}
+_CUSTOM_DB: dict[str, ModelPrice] = {}
 
 # LiteLLM-fetched models (middle priority)
-_LITELLM_DB: Dict[str, ModelPrice] = {}
+_LITELLM_DB: dict[str, ModelPrice] = {}
 
+# Inverted provider -> model-name index so provider-filtered listing is
+# proportional to the matching models instead of a full scan. Names are
+# added at registration/load time; list_models validates each name against
+# the merged view, so entries shadowed or removed by direct tier mutation
+# are skipped rather than served stale.
+_BY_PROVIDER: dict[str, "set[str]"] = defaultdict(set)
 
-def get_price(model: str) -> ModelPrice:
-    """Get pricing information for a model.
+# Frozen LiteLLM snapshot shipped inside the wheel, loaded lazily on the
+# first lookup that misses every live tier. Kept out of the ChainMap (and
+# out of list_models) so live behavior stays deterministic regardless of
+# whether anything has faulted the snapshot in.
+_SNAPSHOT_FILE = Path(__file__).parent / "data" / "litellm_prices.json"
+_SNAPSHOT_DB: dict[str, ModelPrice] = {}
+_snapshot_loaded = False
+
+
+def _load_snapshot() -> None:
+    """Load the packaged pricing snapshot into its fallback tier (once)."""
+    global _snapshot_loaded
+    _snapshot_loaded = True
+    try:
+        import json
+
+        from .pricing_loader import parse_litellm_json
 
-    Resolves pricing in order: user-registered → LiteLLM → hardcoded fallback.
+        _SNAPSHOT_DB.update(parse_litellm_json(json.loads(_SNAPSHOT_FILE.read_text())))
+    except Exception as e:
+        logger.debug("Could not load packaged pricing snapshot: %s", e)
+
+
+# Live merged view over the three tiers, highest priority first. ChainMap
+# lookups short-circuit at C level on the first hit and track mutations of
+# the underlying dicts, so it never goes stale and never needs rebuilding.
+# The hardcoded tier goes in as the raw dict: ChainMap's type requires
+# mutable mappings even though lookups never write to the lower maps, and
+# _PRICING_VIEW still guards direct access elsewhere.
+_CHAIN: "ChainMap[str, ModelPrice]" = ChainMap(_CUSTOM_DB, _LITELLM_DB, _PRICING_DB)
+
+
+def _rebuild_provider_index() -> None:
+    """Rebuild the provider index from the current tier contents."""
+    _BY_PROVIDER.clear()
+    for name, price in _CHAIN.items():
+        _BY_PROVIDER[price.provider].add(name)
+
+
+_rebuild_provider_index()
+
+
+@lru_cache(maxsize=256)
+def _resolve_price(model: str) -> ModelPrice:
+    """Resolve a model price across the three tiers (memoized).
+
+    The memo is cleared whenever a tier changes (register_model,
+    refresh_pricing), so hot models cost one C-level cache hit instead
+    of up to three dict probes per call.
 
     Args:
-        model: Model name (e.g., "gpt-4o", "claude-sonnet-4-5").
+        model: Model name.
 
     Returns:
         ModelPrice object with pricing information.
@@ -94,17 +199,19 @@ def get_price(model: str) -> ModelPrice:
     Raises:
         ModelNotFoundError: If the model is not found in any pricing source.
     """
-    # 1. User-registered models (highest priority)
-    if model in _CUSTOM_DB:
-        return _CUSTOM_DB[model]
-
-    # 2. LiteLLM-fetched models
-    if model in _LITELLM_DB:
-        return _LITELLM_DB[model]
-
-    # 3. Hardcoded fallback
-    if model in _PRICING_DB:
-        return _PRICING_DB[model]
+    try:
+        # ChainMap resolves the three tiers with a single C-level call
+        # that stops at the first hit.
+        return _CHAIN[model]
+    except KeyError:
+        pass
+
+    # Last resort: the packaged snapshot, faulted in on first full miss.
+    if not _snapshot_loaded:
+        _load_snapshot()
+    price = _SNAPSHOT_DB.get(model)
+    if price is not None:
+        return price
 
     raise ModelNotFoundError(
         f"Model '{model}' not found in pricing database. "
@@ -113,6 +220,25 @@ def get_price(model: str) -> ModelPrice:
     )
 
 
+def get_price(model: str) -> ModelPrice:
+    """Get pricing information for a model.
+
+    Resolves pricing in order: user-registered → LiteLLM → hardcoded
+    fallback, with the packaged LiteLLM snapshot as a last resort for
+    models missing from all three tiers.
+
+    Args:
+        model: Model name (e.g., "gpt-4o", "claude-sonnet-4-5").
+
+    Returns:
+        ModelPrice object with pricing information.
+
+    Raises:
+        ModelNotFoundError: If the model is not found in any pricing source.
+    """
+    return _resolve_price(model)
+
+
 def register_model(
     model: str,
     input_per_1k: float,
@@ -130,14 +256,22 @@ def register_model(
         output_per_1k: Cost per 1000 output tokens in USD.
         provider: Provider name (default: "custom").
     """
-    _CUSTOM_DB[model] = ModelPrice(
+    global _price_version
+    # Interning makes later dict lookups on the hot tracking path cheaper;
+    # the provider is interned too so usage_by_provider keys derived from
+    # ModelPrice.provider share storage with caller literals.
+    _CUSTOM_DB[sys.intern(model)] = ModelPrice(
         input_per_1k=input_per_1k,
         output_per_1k=output_per_1k,
-        provider=provider,
+        provider=sys.intern(provider),
     )
+    _BY_PROVIDER[provider].add(model)
+    _price_version += 1
+    _resolve_price.cache_clear()
+    calculate_cost.cache_clear()
 
 
-def list_models(provider: Optional[str] = None) -> Dict[str, ModelPrice]:
+def list_models(provider: Optional[str] = None) -> dict[str, ModelPrice]:
     """List all available models across all pricing sources.
 
     Returns a merged view with user-registered models taking priority
@@ -149,17 +283,20 @@ def list_models(provider: Optional[str] = None) -> Dict[str, ModelPrice]:
     Returns:
         Dictionary of model names to ModelPrice objects.
     """
-    # Merge: hardcoded → litellm → custom (last wins)
-    merged: Dict[str, ModelPrice] = {}
-    merged.update(_PRICING_DB)
-    merged.update(_LITELLM_DB)
-    merged.update(_CUSTOM_DB)
-
+    # Materialize from the live ChainMap view; iteration already yields
+    # each model once with the highest-priority entry winning.
     if provider is None:
-        return merged
-    return {k: v for k, v in merged.items() if v.provider == provider}
+        return dict(_CHAIN)
+    # Walk only the indexed candidates, re-validating against the merged
+    # view so shadowed or deleted names are dropped.
+    return {
+        name: price
+        for name in _BY_PROVIDER.get(provider, ())
+        if (price := _CHAIN.get(name)) is not None and price.provider == provider
+    }
 
 
+@lru_cache(maxsize=4096)
 def calculate_cost(
     model: str,
     input_tokens: int,
@@ -167,6 +304,10 @@ def calculate_cost(
 ) -> float:
     """Calculate the cost of a request.
 
+    Memoized: workloads that repeat the same call shape (identical
+    prompts, cache hits re-pricing the same response) resolve to one
+    C-level cache probe. Cleared whenever a pricing tier changes.
+
     Args:
         model: Model name.
         input_tokens: Number of input tokens.
@@ -179,9 +320,43 @@ def calculate_cost(
         ModelNotFoundError: If the model is not found in the pricing database.
     """
     price = get_price(model)
-    input_cost = (input_tokens / 1000) * price.input_per_1k
-    output_cost = (output_tokens / 1000) * price.output_per_1k
-    return input_cost + output_cost
+    return (
+        input_tokens * price._input_per_token + output_tokens * price._output_per_token
+    )
+
+
+def calculate_cost_batch(
+    models: Sequence[str],
+    input_tokens: Sequence[int],
+    output_tokens: Sequence[int],
+) -> list[float]:
+    """Calculate costs for a batch of requests.
+
+    Each distinct model is resolved once for the whole batch, which
+    amortizes the pricing lookup when processing many responses at a
+    time (e.g. results from a batch API).
+
+    Args:
+        models: Model name for each request.
+        input_tokens: Number of input tokens for each request.
+        output_tokens: Number of output tokens for each request.
+
+    Returns:
+        Total cost in USD for each request, in input order.
+
+    Raises:
+        ModelNotFoundError: If any model is not found in the pricing database.
+    """
+    prices: dict[str, ModelPrice] = {}
+    costs: list[float] = []
+    for model, in_tokens, out_tokens in zip(models, input_tokens, output_tokens):
+        price = prices.get(model)
+        if price is None:
+            price = prices[model] = get_price(model)
+        costs.append(
+            in_tokens * price._input_per_token + out_tokens * price._output_per_token
+        )
+    return costs
 
 
 def refresh_pricing(
@@ -201,6 +376,8 @@ def refresh_pricing(
     Returns:
         True if pricing was successfully fetched and loaded, False otherwise.
     """
+    global _price_version
+
     from .pricing_loader import LITELLM_PRICING_URL, fetch_litellm_pricing
 
     fetch_url = url or LITELLM_PRICING_URL
@@ -209,6 +386,10 @@ def refresh_pricing(
     if result is not None:
         _LITELLM_DB.clear()
         _LITELLM_DB.update(result)
+        _rebuild_provider_index()
+        _price_version += 1
+        _resolve_price.cache_clear()
+        calculate_cost.cache_clear()
         logger.info("Loaded %d models from LiteLLM pricing.", len(result))
         return True
 
@@ -4,13 +4,23 @@ Fetches and parses the LiteLLM community-maintained pricing JSON to provide
 up-to-date pricing for all major LLM models.
 """
 
+import gzip
 import json
 import logging
+import sys
+import time
+import urllib.error
 import urllib.request
-from typing import Any, Dict, Optional
+from pathlib import Path
+from typing import Any, Optional
 
 from .pricing import ModelPrice
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
 logger = logging.getLogger(__name__)
 
 LITELLM_PRICING_URL = (
@@ -18,56 +28,120 @@ LITELLM_PRICING_URL = (
     "model_prices_and_context_window.json"
 )
 
+# Local cache of the last successful download, so repeat refreshes can use
+# a conditional GET and skip re-downloading the full (~2 MB) JSON.
+_CACHE_DIR = Path.home() / ".cache" / "tokenbudget"
+_PRICING_CACHE_FILE = _CACHE_DIR / "litellm_pricing.json"
+_PRICING_META_FILE = _CACHE_DIR / "litellm_pricing.json.meta"
 
-def parse_litellm_json(raw_data: Dict[str, Any]) -> Dict[str, ModelPrice]:
-    """Parse raw LiteLLM JSON into a dictionary of ModelPrice objects.
+# Transient HTTP statuses worth one more attempt, and the pause before it.
+_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+_FETCH_ATTEMPTS = 2
+_RETRY_BACKOFF = 0.1
 
-    Filters to chat models with valid input/output cost per token.
-    Converts per-token costs to per-1k-token costs.
+
+def _read_pricing_meta(url: str) -> dict[str, str]:
+    """Read cached HTTP validators (ETag/Last-Modified) for a pricing URL.
 
     Args:
-        raw_data: Raw JSON data from LiteLLM pricing file.
+        url: URL the cached copy was fetched from.
 
     Returns:
-        Dictionary mapping model names to ModelPrice objects.
+        Metadata dictionary, or an empty dict when there is no usable cache.
     """
-    models: Dict[str, ModelPrice] = {}
+    try:
+        meta = json.loads(_PRICING_META_FILE.read_text())
+    except Exception:
+        return {}
+    if not isinstance(meta, dict) or meta.get("url") != url:
+        return {}
+    return meta
 
-    for model_name, model_data in raw_data.items():
-        if not isinstance(model_data, dict):
-            continue
 
-        # Skip spec/sample entries
-        if model_name == "sample_spec":
-            continue
+def _write_pricing_cache(
+    url: str, body: bytes, etag: Optional[str], last_modified: Optional[str]
+) -> None:
+    """Persist a downloaded pricing body and its HTTP validators.
 
-        # Skip entries without valid pricing
-        input_cost_per_token = model_data.get("input_cost_per_token")
-        output_cost_per_token = model_data.get("output_cost_per_token")
-        if input_cost_per_token is None or output_cost_per_token is None:
-            continue
+    Failures are ignored: the cache is purely an optimization.
 
-        provider = model_data.get("litellm_provider", "")
+    Args:
+        url: URL the body was fetched from.
+        body: Raw response bytes.
+        etag: ETag response header, if any.
+        last_modified: Last-Modified response header, if any.
+    """
+    try:
+        _CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        _PRICING_CACHE_FILE.write_bytes(body)
+        meta: dict[str, str] = {"url": url}
+        if etag:
+            meta["etag"] = etag
+        if last_modified:
+            meta["last_modified"] = last_modified
+        _PRICING_META_FILE.write_text(json.dumps(meta))
+    except Exception as e:
+        logger.debug("Could not write pricing cache: %s", e)
 
-        # Convert per-token to per-1k-token
-        input_per_1k = float(input_cost_per_token) * 1000
-        output_per_1k = float(output_cost_per_token) * 1000
 
-        models[model_name] = ModelPrice(
-            input_per_1k=input_per_1k,
-            output_per_1k=output_per_1k,
-            provider=provider,
-        )
+def parse_litellm_json(raw_data: dict[str, Any]) -> dict[str, ModelPrice]:
+    """Parse raw LiteLLM JSON into a dictionary of ModelPrice objects.
 
-    return models
+    Filters to chat models with valid input/output cost per token.
+    Converts per-token costs to per-1k-token costs.
+
+    Args:
+        raw_data: Raw JSON data from LiteLLM pricing file.
+
+    Returns:
+        Dictionary mapping model names to ModelPrice objects.
+    """
+    # Many LiteLLM entries are aliases (versioned names) with identical
+    # pricing; interning shares one immutable ModelPrice per unique
+    # (input, output, provider) triple instead of one instance per alias.
+    interned: dict[tuple[float, float, str], ModelPrice] = {}
+
+    def _price(input_cost: Any, output_cost: Any, provider: str) -> ModelPrice:
+        # Interned provider names share storage across the thousands of
+        # entries and with the literals used as usage_by_provider keys.
+        key = (float(input_cost) * 1000, float(output_cost) * 1000, sys.intern(provider))
+        price = interned.get(key)
+        if price is None:
+            price = interned[key] = ModelPrice(
+                input_per_1k=key[0], output_per_1k=key[1], provider=key[2]
+            )
+        return price
+
+    # Single comprehension keeps the per-entry loop in C-level dispatch;
+    # the walrus assignments filter out entries without valid pricing and
+    # convert per-token costs to per-1k-token costs in one pass. Keys are
+    # interned so lookups with literal model names in callers hit the
+    # pointer-equality fast path instead of a full string compare.
+    return {
+        sys.intern(model_name): _price(
+            input_cost, output_cost, model_data.get("litellm_provider", "")
+        )
+        for model_name, model_data in raw_data.items()
+        if isinstance(model_data, dict)
+        and model_name != "sample_spec"
+        and (input_cost := model_data.get("input_cost_per_token")) is not None
+        and (output_cost := model_data.get("output_cost_per_token")) is not None
+    }
 
 
 def fetch_litellm_pricing(
     url: str = LITELLM_PRICING_URL,
     timeout: int = 10,
-) -> Optional[Dict[str, ModelPrice]]:
+) -> Optional[dict[str, ModelPrice]]:
     """Fetch and parse LiteLLM pricing from the remote URL.
 
+    The last successful download is cached on disk together with its
+    ETag/Last-Modified headers; subsequent fetches send a conditional GET
+    and reuse the cached body on a 304 Not Modified response. The request
+    advertises gzip, which cuts the ~2 MB payload to a fraction on the
+    wire, and transient failures (connection errors, 5xx/429) get one
+    retry after a short pause.
+
     Args:
         url: URL to fetch pricing JSON from.
         timeout: Request timeout in seconds.
@@ -75,10 +149,46 @@ def fetch_litellm_pricing(
     Returns:
         Dictionary of ModelPrice objects, or None if fetch fails.
     """
+    headers: dict[str, str] = {"Accept-Encoding": "gzip"}
+    meta = _read_pricing_meta(url)
+    if meta and _PRICING_CACHE_FILE.exists():
+        if "etag" in meta:
+            headers["If-None-Match"] = meta["etag"]
+        if "last_modified" in meta:
+            headers["If-Modified-Since"] = meta["last_modified"]
+
     try:
-        request = urllib.request.Request(url)
-        with urllib.request.urlopen(request, timeout=timeout) as response:
-            raw_data = json.loads(response.read().decode("utf-8"))
+        request = urllib.request.Request(url, headers=headers)
+        for attempt in range(_FETCH_ATTEMPTS):
+            try:
+                with urllib.request.urlopen(request, timeout=timeout) as response:
+                    body = response.read()
+                    if response.headers.get("Content-Encoding") == "gzip":
+                        body = gzip.decompress(body)
+                    _write_pricing_cache(
+                        url,
+                        body,
+                        response.headers.get("ETag"),
+                        response.headers.get("Last-Modified"),
+                    )
+                break
+            except urllib.error.HTTPError as e:
+                if e.code == 304:
+                    # Not modified: parse the cached copy instead of
+                    # re-downloading.
+                    body = _PRICING_CACHE_FILE.read_bytes()
+                    break
+                if e.code in _RETRY_STATUSES and attempt + 1 < _FETCH_ATTEMPTS:
+                    time.sleep(_RETRY_BACKOFF)
+                    continue
+                raise
+            except urllib.error.URLError:
+                if attempt + 1 < _FETCH_ATTEMPTS:
+                    time.sleep(_RETRY_BACKOFF)
+                    continue
+                raise
+        # Both parsers accept bytes directly, so skip the utf-8 decode.
+        raw_data = orjson.loads(body) if orjson is not None else json.loads(body)
         return parse_litellm_json(raw_data)
     except Exception as e:
         logger.warning("Failed to fetch LiteLLM pricing: %s", e)
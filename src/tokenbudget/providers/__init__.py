@@ -1,5 +1,33 @@
 """Provider wrappers for tokenbudget."""
 
+from typing import TYPE_CHECKING, Any
+
 from .base import BaseProvider
 
-__all__ = ["BaseProvider"]
+if TYPE_CHECKING:
+    from .anthropic import AnthropicWrapper
+    from .custom import CustomProvider
+    from .openai import OpenAIWrapper
+
+__all__ = ["AnthropicWrapper", "BaseProvider", "CustomProvider", "OpenAIWrapper"]
+
+# Concrete wrappers resolve lazily (PEP 562): importing this package never
+# pulls in a provider module, keeping import time independent of which SDKs
+# are installed. After first access the attribute is cached on the module,
+# so subsequent lookups are plain namespace hits.
+_LAZY_WRAPPERS = {
+    "AnthropicWrapper": ".anthropic",
+    "CustomProvider": ".custom",
+    "OpenAIWrapper": ".openai",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_WRAPPERS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
@@ -1,15 +1,67 @@
 """Anthropic provider wrapper."""
 
-from typing import Any
+import copy
+from typing import Any, Optional
 
-from ..budget import get_current_budget
+from ..budget import budget_active, get_current_budget
+from ..cache import set_in_background
 from ..pricing import calculate_cost
 from .base import BaseProvider
 
+# Marker key for cache entries holding a dumped Message rather than a
+# pickled SDK object.
+_MESSAGE_KEY = "__tokenbudget_anthropic_message__"
+
+
+def _normalize_response(response: Any) -> Any:
+    """Reduce an SDK Message to a plain dict for caching.
+
+    Pickling the full response drags SDK internals (HTTP client refs,
+    headers) into every cache entry. The model_dump payload is a
+    fraction of the size, msgpack-serializable, and survives SDK
+    upgrades better than a pickled object graph.
+
+    Args:
+        response: Anthropic response object.
+
+    Returns:
+        Tagged dict for cacheable responses, the response itself otherwise.
+    """
+    dump = getattr(response, "model_dump", None)
+    if dump is None:
+        return response
+    try:
+        return {_MESSAGE_KEY: dump(mode="json")}
+    except Exception:
+        return response
+
+
+def _rebuild_response(cached: Any) -> Any:
+    """Rebuild a cached entry into a response object.
+
+    Args:
+        cached: Value retrieved from the cache.
+
+    Returns:
+        A Message for tagged entries, the value unchanged for legacy
+        pickled entries, or None if the entry cannot be rebuilt.
+    """
+    if isinstance(cached, dict) and _MESSAGE_KEY in cached:
+        try:
+            from anthropic.types import Message
+
+            return Message.model_validate(cached[_MESSAGE_KEY])
+        except Exception:
+            # Treat an unrebuildable entry (SDK drift) as a miss.
+            return None
+    return cached
+
 
 class AnthropicWrapper(BaseProvider):
     """Wrapper for Anthropic client that tracks token usage."""
 
+    __slots__ = ("messages", "_extract")
+
     def __init__(self, client: Any, tracker: Any) -> None:
         """Initialize Anthropic wrapper.
 
@@ -18,6 +70,9 @@ class AnthropicWrapper(BaseProvider):
             tracker: TokenTracker instance.
         """
         super().__init__(client, tracker)
+        # Cache the bound extractor so per-response paths skip the type
+        # dict method lookup and call a prebound object directly.
+        self._extract = self._extract_usage
 
         # Wrap the messages.create method
         self.messages = MessagesWrapper(client.messages, self)
@@ -31,11 +86,8 @@ class AnthropicWrapper(BaseProvider):
         Returns:
             Tuple of (model, prompt_tokens, completion_tokens).
         """
-        model = response.model
         usage = response.usage
-        prompt_tokens = usage.input_tokens
-        completion_tokens = usage.output_tokens
-        return model, prompt_tokens, completion_tokens
+        return response.model, usage.input_tokens, usage.output_tokens
 
     def _track_response(self, response: Any, from_cache: bool = False) -> Any:
         """Track a response and check budget limits.
@@ -47,7 +99,7 @@ class AnthropicWrapper(BaseProvider):
         Returns:
             The response object.
         """
-        model, prompt_tokens, completion_tokens = self._extract_usage(response)
+        model, prompt_tokens, completion_tokens = self._extract(response)
 
         if from_cache:
             # Record cache hit
@@ -65,8 +117,13 @@ class AnthropicWrapper(BaseProvider):
                 provider="anthropic",
             )
 
-        # Check budget limits if in budget context
-        budget_ctx = get_current_budget()
+        # Check budget limits if in budget context. A budget entered with
+        # this tracker is bound directly on it (one attribute read); the
+        # counter-guarded ContextVar lookup covers budgets on other
+        # trackers and costs nothing when no budget is active at all.
+        budget_ctx = self._tracker._active_budget
+        if budget_ctx is None and budget_active():
+            budget_ctx = get_current_budget()
         if budget_ctx is not None:
             budget_ctx.check_limits()
 
@@ -87,6 +144,17 @@ class AnthropicWrapper(BaseProvider):
 class MessagesWrapper:
     """Wrapper for Anthropic messages."""
 
+    # Slots also turn the hot self._parent / self._cache loads in create()
+    # into fixed-offset reads instead of instance-dict probes.
+    __slots__ = (
+        "_messages",
+        "_parent",
+        "_cache",
+        "_cache_get",
+        "_make_key",
+        "_last",
+    )
+
     def __init__(self, messages: Any, parent: AnthropicWrapper) -> None:
         """Initialize messages wrapper.
 
@@ -96,6 +164,43 @@ class MessagesWrapper:
         """
         self._messages = messages
         self._parent = parent
+        # The tracker's cache is fixed at construction, so resolve the
+        # bound methods once here instead of re-dispatching through the
+        # Cache ABC on every create() call.
+        cache = parent._tracker.get_cache()
+        self._cache = cache
+        self._cache_get = cache.get if cache is not None else None
+        self._make_key = cache.make_key if cache is not None else None
+        self._last: Optional[tuple[dict[str, Any], Any]] = None
+
+    def _request_key(self, kwargs: dict[str, Any]) -> Any:
+        """Compute the cache key, reusing the previous call's digest.
+
+        Agent loops often retry the exact same request; comparing against
+        a deep snapshot of the last call's kwargs (identical sub-objects
+        compare by identity at the C level) is cheaper than re-serializing
+        and re-hashing a large messages list. The snapshot shares nothing
+        with caller objects, so any in-place mutation — appending to the
+        messages list or editing a message dict — fails the comparison
+        and recomputes the key. The snapshot and its key live in one
+        tuple read and written atomically, so a concurrent create() on
+        another thread can replace the memo but never pair one request's
+        snapshot with another request's key.
+
+        Args:
+            kwargs: Request keyword arguments.
+
+        Returns:
+            Cache key for the request.
+        """
+        last = self._last
+        if last is not None and kwargs == last[0]:
+            return last[1]
+        make_key = self._make_key
+        assert make_key is not None  # bound whenever a cache is configured
+        key = make_key(kwargs)
+        self._last = (copy.deepcopy(kwargs), key)
+        return key
 
     def create(self, **kwargs: Any) -> Any:
         """Create a message with tracking.
@@ -106,29 +211,57 @@ class MessagesWrapper:
         Returns:
             Message response.
         """
-        cache = self._parent._tracker.get_cache()
+        # Hoist the chained attribute loads to locals: LOAD_FAST per use
+        # instead of a LOAD_ATTR chain in this per-request method.
+        parent = self._parent
+        track = parent._track_response
+        cache = self._cache
 
         # Check cache if enabled
         if cache is not None:
-            cache_key = cache.make_key(kwargs)
-            cached_response = cache.get(cache_key)
-
-            if cached_response is not None:
-                # Cache hit
-                return self._parent._track_response(cached_response, from_cache=True)
+            cache_get = self._cache_get
+            assert cache_get is not None  # bound whenever a cache is configured
+            cache_key = self._request_key(kwargs)
+            cached = cache_get(cache_key)
+
+            if cached is not None:
+                # Entries written by this version carry the usage and cost
+                # computed at store time, so a hit skips usage extraction
+                # and re-pricing entirely. msgpack round-trips tuples as
+                # lists, so disk-backed entries come back as either shape.
+                if isinstance(cached, (tuple, list)) and len(cached) == 5:
+                    payload, _model, prompt_tokens, completion_tokens, cost = cached
+                    response = _rebuild_response(payload)
+                    if response is not None:
+                        return parent._track_cache_hit(
+                            response, prompt_tokens + completion_tokens, cost
+                        )
+                else:
+                    # Legacy entry holding a bare payload.
+                    response = _rebuild_response(cached)
+                    if response is not None:
+                        return track(response, from_cache=True)
 
             # Cache miss
-            self._parent._tracker.record_cache_miss()
+            parent._tracker.record_cache_miss()
 
         # Make API call
         response = self._messages.create(**kwargs)
 
-        # Cache the response if caching is enabled
+        # Cache the response if caching is enabled; write-behind keeps
+        # serialization and disk I/O off the response path. The usage and
+        # cost are stored alongside so hits never recompute them.
         if cache is not None:
-            cache.set(cache_key, response)
+            model, prompt_tokens, completion_tokens = parent._extract(response)
+            cost = calculate_cost(model, prompt_tokens, completion_tokens)
+            set_in_background(
+                cache,
+                cache_key,
+                (_normalize_response(response), model, prompt_tokens, completion_tokens, cost),
+            )
 
         # Track the response
-        return self._parent._track_response(response, from_cache=False)
+        return track(response, from_cache=False)
 
     def __getattr__(self, name: str) -> Any:
         """Forward attribute access to the original messages object.
@@ -3,6 +3,8 @@
 from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING, Any
 
+from ..budget import budget_active, get_current_budget
+
 if TYPE_CHECKING:
     from ..tracker import TokenTracker
 
@@ -13,6 +15,8 @@ class BaseProvider(ABC):
     All provider wrappers should inherit from this class.
     """
 
+    __slots__ = ("_client", "_tracker")
+
     def __init__(self, client: Any, tracker: "TokenTracker") -> None:
         """Initialize the provider wrapper.
 
@@ -35,6 +39,28 @@ class BaseProvider(ABC):
         """
         pass
 
+    def _track_cache_hit(self, response: Any, saved_tokens: int, saved_cost: float) -> Any:
+        """Record a cache hit with precomputed savings and check budgets.
+
+        Fast path for cache entries that carry their usage alongside the
+        response: no usage extraction or cost calculation is needed.
+
+        Args:
+            response: The cached response object.
+            saved_tokens: Tokens saved by serving from cache.
+            saved_cost: Cost in USD saved by serving from cache.
+
+        Returns:
+            The response object.
+        """
+        self._tracker.record_cache_hit(saved_tokens=saved_tokens, saved_cost=saved_cost)
+        budget_ctx = self._tracker._active_budget
+        if budget_ctx is None and budget_active():
+            budget_ctx = get_current_budget()
+        if budget_ctx is not None:
+            budget_ctx.check_limits()
+        return response
+
     @property
     def original_client(self) -> Any:
         """Get the original unwrapped client.
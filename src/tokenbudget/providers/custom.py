@@ -1,5 +1,6 @@
 """Custom provider support for tokenbudget."""
 
+import sys
 from typing import Any, Callable
 
 from ..tracker import TokenTracker
@@ -50,20 +51,34 @@ class CustomProvider:
             custom.track(api_response)
         """
         self.tracker = tracker
-        self.provider_name = provider_name
+        # Interned once here so every track() call keys usage_by_provider
+        # with a string that hits the pointer-equality fast path.
+        self.provider_name = sys.intern(provider_name)
         self._extract_model = extract_model
         self._extract_prompt_tokens = extract_prompt_tokens
         self._extract_completion_tokens = extract_completion_tokens
 
+        # Compose the three user callables into one closure at
+        # construction: track() then makes a single call whose locals are
+        # the extractors, instead of three instance-attribute loads and
+        # dispatches per response.
+        def _extract(
+            response: Any,
+            _model: Callable[[Any], str] = extract_model,
+            _prompt: Callable[[Any], int] = extract_prompt_tokens,
+            _completion: Callable[[Any], int] = extract_completion_tokens,
+        ) -> "tuple[str, int, int]":
+            return _model(response), _prompt(response), _completion(response)
+
+        self._extract = _extract
+
     def track(self, response: Any) -> None:
         """Track a custom provider response.
 
         Args:
             response: API response object.
         """
-        model = self._extract_model(response)
-        prompt_tokens = self._extract_prompt_tokens(response)
-        completion_tokens = self._extract_completion_tokens(response)
+        model, prompt_tokens, completion_tokens = self._extract(response)
 
         self.tracker.track(
             model=model,
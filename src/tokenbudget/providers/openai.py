@@ -1,8 +1,10 @@
 """OpenAI provider wrapper."""
 
+import copy
 from typing import Any, Optional
 
-from ..budget import get_current_budget
+from ..budget import budget_active, get_current_budget
+from ..cache import set_in_background
 from ..pricing import calculate_cost
 from .base import BaseProvider
 
@@ -10,6 +12,8 @@ from .base import BaseProvider
 class OpenAIWrapper(BaseProvider):
     """Wrapper for OpenAI client that tracks token usage."""
 
+    __slots__ = ("chat", "_extract")
+
     def __init__(self, client: Any, tracker: Any) -> None:
         """Initialize OpenAI wrapper.
 
@@ -18,6 +22,9 @@ class OpenAIWrapper(BaseProvider):
             tracker: TokenTracker instance.
         """
         super().__init__(client, tracker)
+        # Cache the bound extractor so per-response paths skip the type
+        # dict method lookup and call a prebound object directly.
+        self._extract = self._extract_usage
 
         # Wrap the chat.completions.create method
         self.chat = ChatWrapper(client.chat, self)
@@ -31,11 +38,8 @@ class OpenAIWrapper(BaseProvider):
         Returns:
             Tuple of (model, prompt_tokens, completion_tokens).
         """
-        model = response.model
         usage = response.usage
-        prompt_tokens = usage.prompt_tokens
-        completion_tokens = usage.completion_tokens
-        return model, prompt_tokens, completion_tokens
+        return response.model, usage.prompt_tokens, usage.completion_tokens
 
     def _track_response(self, response: Any, from_cache: bool = False) -> Any:
         """Track a response and check budget limits.
@@ -47,7 +51,7 @@ class OpenAIWrapper(BaseProvider):
         Returns:
             The response object.
         """
-        model, prompt_tokens, completion_tokens = self._extract_usage(response)
+        model, prompt_tokens, completion_tokens = self._extract(response)
 
         if from_cache:
             # Record cache hit
@@ -65,8 +69,13 @@ class OpenAIWrapper(BaseProvider):
                 provider="openai",
             )
 
-        # Check budget limits if in budget context
-        budget_ctx = get_current_budget()
+        # Check budget limits if in budget context. A budget entered with
+        # this tracker is bound directly on it (one attribute read); the
+        # counter-guarded ContextVar lookup covers budgets on other
+        # trackers and costs nothing when no budget is active at all.
+        budget_ctx = self._tracker._active_budget
+        if budget_ctx is None and budget_active():
+            budget_ctx = get_current_budget()
         if budget_ctx is not None:
             budget_ctx.check_limits()
 
@@ -87,6 +96,8 @@ class OpenAIWrapper(BaseProvider):
 class ChatWrapper:
     """Wrapper for OpenAI chat completions."""
 
+    __slots__ = ("_chat", "_parent", "completions")
+
     def __init__(self, chat: Any, parent: OpenAIWrapper) -> None:
         """Initialize chat wrapper.
 
@@ -113,6 +124,17 @@ class ChatWrapper:
 class CompletionsWrapper:
     """Wrapper for OpenAI chat completions create method."""
 
+    # Slots also turn the hot self._parent / self._cache loads in create()
+    # into fixed-offset reads instead of instance-dict probes.
+    __slots__ = (
+        "_completions",
+        "_parent",
+        "_cache",
+        "_cache_get",
+        "_make_key",
+        "_last",
+    )
+
     def __init__(self, completions: Any, parent: OpenAIWrapper) -> None:
         """Initialize completions wrapper.
 
@@ -122,6 +144,43 @@ class CompletionsWrapper:
         """
         self._completions = completions
         self._parent = parent
+        # The tracker's cache is fixed at construction, so resolve the
+        # bound methods once here instead of re-dispatching through the
+        # Cache ABC on every create() call.
+        cache = parent._tracker.get_cache()
+        self._cache = cache
+        self._cache_get = cache.get if cache is not None else None
+        self._make_key = cache.make_key if cache is not None else None
+        self._last: Optional[tuple[dict[str, Any], Any]] = None
+
+    def _request_key(self, kwargs: dict[str, Any]) -> Any:
+        """Compute the cache key, reusing the previous call's digest.
+
+        Agent loops often retry the exact same request; comparing against
+        a deep snapshot of the last call's kwargs (identical sub-objects
+        compare by identity at the C level) is cheaper than re-serializing
+        and re-hashing a large messages list. The snapshot shares nothing
+        with caller objects, so any in-place mutation — appending to the
+        messages list or editing a message dict — fails the comparison
+        and recomputes the key. The snapshot and its key live in one
+        tuple read and written atomically, so a concurrent create() on
+        another thread can replace the memo but never pair one request's
+        snapshot with another request's key.
+
+        Args:
+            kwargs: Request keyword arguments.
+
+        Returns:
+            Cache key for the request.
+        """
+        last = self._last
+        if last is not None and kwargs == last[0]:
+            return last[1]
+        make_key = self._make_key
+        assert make_key is not None  # bound whenever a cache is configured
+        key = make_key(kwargs)
+        self._last = (copy.deepcopy(kwargs), key)
+        return key
 
     def create(self, **kwargs: Any) -> Any:
         """Create a chat completion with tracking.
@@ -132,29 +191,50 @@ class CompletionsWrapper:
         Returns:
             Chat completion response.
         """
-        cache = self._parent._tracker.get_cache()
+        # Hoist the chained attribute loads to locals: LOAD_FAST per use
+        # instead of a LOAD_ATTR chain in this per-request method.
+        parent = self._parent
+        track = parent._track_response
+        cache = self._cache
 
         # Check cache if enabled
         if cache is not None:
-            cache_key = cache.make_key(kwargs)
-            cached_response = cache.get(cache_key)
+            cache_get = self._cache_get
+            assert cache_get is not None  # bound whenever a cache is configured
+            cache_key = self._request_key(kwargs)
+            cached_response = cache_get(cache_key)
 
             if cached_response is not None:
-                # Cache hit
-                return self._parent._track_response(cached_response, from_cache=True)
+                # Entries written by this version carry the usage and cost
+                # computed at store time, so a hit skips usage extraction
+                # and re-pricing entirely. msgpack round-trips tuples as
+                # lists, so disk-backed entries come back as either shape.
+                if isinstance(cached_response, (tuple, list)) and len(cached_response) == 5:
+                    response, _model, prompt_tokens, completion_tokens, cost = cached_response
+                    return parent._track_cache_hit(
+                        response, prompt_tokens + completion_tokens, cost
+                    )
+                # Legacy entry holding the bare response object.
+                return track(cached_response, from_cache=True)
 
             # Cache miss
-            self._parent._tracker.record_cache_miss()
+            parent._tracker.record_cache_miss()
 
         # Make API call
         response = self._completions.create(**kwargs)
 
-        # Cache the response if caching is enabled
+        # Cache the response if caching is enabled; write-behind keeps
+        # serialization and disk I/O off the response path. The usage and
+        # cost are stored alongside so hits never recompute them.
         if cache is not None:
-            cache.set(cache_key, response)
+            model, prompt_tokens, completion_tokens = parent._extract(response)
+            cost = calculate_cost(model, prompt_tokens, completion_tokens)
+            set_in_background(
+                cache, cache_key, (response, model, prompt_tokens, completion_tokens, cost)
+            )
 
         # Track the response
-        return self._parent._track_response(response, from_cache=False)
+        return track(response, from_cache=False)
 
     def __getattr__(self, name: str) -> Any:
         """Forward attribute access to the original completions object.
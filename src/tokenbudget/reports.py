@@ -6,6 +6,11 @@ from typing import TYPE_CHECKING, Any, Dict, List
 
 from .utils import format_cost, format_number
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
 if TYPE_CHECKING:
     from .tracker import TokenTracker
 
@@ -19,8 +24,9 @@ def generate_table_report(tracker: "TokenTracker") -> str:
     Returns:
         Formatted table string.
     """
-    usage_by_provider = tracker.usage_by_provider
-    cache_stats = tracker.cache_stats
+    snap = tracker.snapshot()
+    usage_by_provider = snap.by_provider
+    cache_stats = snap.cache_stats
 
     if not usage_by_provider:
         return "No usage data to report."
@@ -29,46 +35,57 @@ def generate_table_report(tracker: "TokenTracker") -> str:
     max_provider_len = max(len(p) for p in usage_by_provider.keys())
     provider_width = max(max_provider_len, len("Provider"))
 
-    # Build table
-    lines = []
-    lines.append("┌" + "─" * (provider_width + 32) + "┐")
-    lines.append("│ TokenBudget Usage Report" + " " * (provider_width + 8) + "│")
-    lines.append("├" + "─" * (provider_width + 32) + "┤")
+    # Precompute the border and row templates once: the format spec is
+    # parsed a single time and reused for every row instead of building a
+    # fresh f-string (and re-multiplying the border) per line.
+    border = "─" * (provider_width + 32)
+    row_fmt = f"│ {{name:<{provider_width}}} │ {{calls:>5}} │ {{tokens:>6}} │ {{cost:>6}} │"
 
-    # Header
-    header = f"│ {'Provider':<{provider_width}} │ Calls │ Tokens │ Cost   │"
-    lines.append(header)
-    lines.append("├" + "─" * (provider_width + 32) + "┤")
+    # Build table
+    lines = [
+        "┌" + border + "┐",
+        "│ TokenBudget Usage Report" + " " * (provider_width + 8) + "│",
+        "├" + border + "┤",
+        f"│ {'Provider':<{provider_width}} │ Calls │ Tokens │ Cost   │",
+        "├" + border + "┤",
+    ]
 
     # Provider rows
-    for provider, usage in sorted(usage_by_provider.items()):
-        tokens_str = format_number(usage.total_tokens)
-        cost_str = format_cost(usage.total_cost_usd)
-        row = f"│ {provider:<{provider_width}} │ {usage.calls:5d} │ {tokens_str:>6} │ {cost_str:>6} │"
-        lines.append(row)
+    lines.extend(
+        row_fmt.format(
+            name=provider,
+            calls=usage_by_provider[provider].calls,
+            tokens=format_number(usage_by_provider[provider].total_tokens),
+            cost=format_cost(usage_by_provider[provider].total_cost_usd),
+        )
+        for provider in tracker.sorted_providers()
+        if provider in usage_by_provider
+    )
 
     # Total row
-    total_usage = tracker.usage
-    total_tokens_str = format_number(total_usage.total_tokens)
-    total_cost_str = format_cost(total_usage.total_cost_usd)
-    lines.append("├" + "─" * (provider_width + 32) + "┤")
-    total_row = (
-        f"│ {'Total':<{provider_width}} │ {total_usage.calls:5d} │ "
-        f"{total_tokens_str:>6} │ {total_cost_str:>6} │"
+    total_usage = snap.usage
+    lines.append("├" + border + "┤")
+    lines.append(
+        row_fmt.format(
+            name="Total",
+            calls=total_usage.calls,
+            tokens=format_number(total_usage.total_tokens),
+            cost=format_cost(total_usage.total_cost_usd),
+        )
     )
-    lines.append(total_row)
 
     # Cache stats if applicable
     if cache_stats.hits > 0:
-        saved_tokens_str = format_number(cache_stats.saved_tokens)
-        saved_cost_str = format_cost(cache_stats.saved_cost_usd)
-        cache_row = (
-            f"│ {'Cache Saved':<{provider_width}} │ {' ':>5} │ "
-            f"{saved_tokens_str:>6} │ {saved_cost_str:>6} │"
+        lines.append(
+            row_fmt.format(
+                name="Cache Saved",
+                calls=" ",
+                tokens=format_number(cache_stats.saved_tokens),
+                cost=format_cost(cache_stats.saved_cost_usd),
+            )
         )
-        lines.append(cache_row)
 
-    lines.append("└" + "─" * (provider_width + 32) + "┘")
+    lines.append("└" + border + "┘")
 
     return "\n".join(lines)
 
@@ -80,40 +97,46 @@ def export_csv(tracker: "TokenTracker", filepath: str) -> None:
         tracker: TokenTracker instance.
         filepath: Path to CSV file.
     """
-    usage_by_provider = tracker.usage_by_provider
+    usage_by_provider = tracker.snapshot().by_provider
+
+    rows = [
+        (
+            provider,
+            usage.calls,
+            usage.total_tokens,
+            usage.prompt_tokens,
+            usage.completion_tokens,
+            f"{usage.total_cost_usd:.6f}",
+        )
+        for provider in tracker.sorted_providers()
+        if (usage := usage_by_provider.get(provider)) is not None
+    ]
 
-    with open(filepath, "w", newline="") as f:
+    # Large write buffer plus a single writerows() amortizes the kernel
+    # write() calls if this ever grows to row-per-call exports.
+    with open(filepath, "w", newline="", buffering=1 << 20) as f:
         writer = csv.writer(f)
         writer.writerow(
             ["provider", "calls", "total_tokens", "prompt_tokens", "completion_tokens", "cost_usd"]
         )
-
-        for provider, usage in sorted(usage_by_provider.items()):
-            writer.writerow(
-                [
-                    provider,
-                    usage.calls,
-                    usage.total_tokens,
-                    usage.prompt_tokens,
-                    usage.completion_tokens,
-                    f"{usage.total_cost_usd:.6f}",
-                ]
-            )
+        writer.writerows(rows)
 
 
-def export_json(tracker: "TokenTracker", filepath: str) -> None:
+def export_json(tracker: "TokenTracker", filepath: str, pretty: bool = True) -> None:
     """Export usage data to JSON.
 
     Args:
         tracker: TokenTracker instance.
         filepath: Path to JSON file.
+        pretty: Indent the output for human readers. Pass False for the
+            fastest, most compact machine-readable dump.
     """
-    usage_by_provider = tracker.usage_by_provider
-    cache_stats = tracker.cache_stats
+    snap = tracker.snapshot()
+    cache_stats = snap.cache_stats
 
     data: Dict[str, Any] = {
-        "total": tracker.usage.model_dump(),
-        "by_provider": {p: u.model_dump() for p, u in usage_by_provider.items()},
+        "total": snap.usage._asdict(),
+        "by_provider": {p: u._asdict() for p, u in snap.by_provider.items()},
         "cache_stats": {
             "hits": cache_stats.hits,
             "misses": cache_stats.misses,
@@ -122,5 +145,15 @@ def export_json(tracker: "TokenTracker", filepath: str) -> None:
         },
     }
 
-    with open(filepath, "w") as f:
-        json.dump(data, f, indent=2)
+    if orjson is not None:
+        # orjson serializes (and indents) at C level in one shot.
+        payload = orjson.dumps(data, option=orjson.OPT_INDENT_2 if pretty else 0)
+        with open(filepath, "wb", buffering=1 << 20) as f:
+            f.write(payload)
+        return
+
+    with open(filepath, "w", buffering=1 << 20) as f:
+        if pretty:
+            json.dump(data, f, indent=2)
+        else:
+            json.dump(data, f, separators=(",", ":"))
@@ -1,19 +1,56 @@
 """Core token and cost tracking engine."""
 
 import threading
-from dataclasses import dataclass, field
-from typing import Any, Dict, Optional
+from collections import namedtuple
+from types import MappingProxyType
+from typing import Any, Optional
 
-from pydantic import BaseModel, Field
-
-from .cache import Cache
+from . import pricing as _pricing
+from .cache import Cache, DiskCache, MemoryCache, SQLiteCache
 from .exceptions import ProviderNotFoundError
-from .pricing import calculate_cost
+from .pricing import get_price
+
+# Immutable point-in-time views. Reports read these instead of the locked
+# copying properties, so one lock acquisition covers a whole report.
+UsageTuple = namedtuple(
+    "UsageTuple",
+    ["total_tokens", "prompt_tokens", "completion_tokens", "total_cost_usd", "calls"],
+)
+CacheStatsTuple = namedtuple(
+    "CacheStatsTuple", ["hits", "misses", "saved_cost_usd", "saved_tokens"]
+)
+TrackerSnapshot = namedtuple("TrackerSnapshot", ["usage", "by_provider", "cache_stats"])
+
+# Cache backends selectable by name in the constructor. Resolved at module
+# import so tracker creation is a dict lookup, not a per-instance import.
+_BACKENDS = {"memory": MemoryCache, "disk": DiskCache, "sqlite": SQLiteCache}
+
+
+class _NullLock:
+    """No-op stand-in for threading.Lock on single-threaded trackers.
+
+    Entering and exiting are empty method calls, so trackers built with
+    thread_safe=False skip the atomic acquire/release (and any futex
+    syscall under contention) on every track() and read.
+    """
+
+    __slots__ = ()
+
+    def __enter__(self) -> "_NullLock":
+        return self
 
+    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        pass
 
-class Usage(BaseModel):
+
+class Usage:
     """Token usage and cost information.
 
+    A plain __slots__ class rather than a Pydantic model: instances are
+    created and mutated on every tracked API call, where validator
+    dispatch and a per-instance __dict__ are pure overhead. Counters
+    only ever receive non-negative increments from the tracker.
+
     Attributes:
         total_tokens: Total number of tokens used.
         prompt_tokens: Number of prompt/input tokens.
@@ -22,11 +59,27 @@ class Usage(BaseModel):
         calls: Number of API calls made.
     """
 
-    total_tokens: int = Field(default=0, ge=0)
-    prompt_tokens: int = Field(default=0, ge=0)
-    completion_tokens: int = Field(default=0, ge=0)
-    total_cost_usd: float = Field(default=0.0, ge=0.0)
-    calls: int = Field(default=0, ge=0)
+    __slots__ = (
+        "total_tokens",
+        "prompt_tokens",
+        "completion_tokens",
+        "total_cost_usd",
+        "calls",
+    )
+
+    def __init__(
+        self,
+        total_tokens: int = 0,
+        prompt_tokens: int = 0,
+        completion_tokens: int = 0,
+        total_cost_usd: float = 0.0,
+        calls: int = 0,
+    ) -> None:
+        self.total_tokens = total_tokens
+        self.prompt_tokens = prompt_tokens
+        self.completion_tokens = completion_tokens
+        self.total_cost_usd = total_cost_usd
+        self.calls = calls
 
     def add(self, other: "Usage") -> None:
         """Add another Usage object to this one.
@@ -40,8 +93,58 @@ class Usage(BaseModel):
         self.total_cost_usd += other.total_cost_usd
         self.calls += other.calls
 
+    def copy(self) -> "Usage":
+        """Return an independent copy of this Usage.
+
+        Returns:
+            New Usage with the same values.
+        """
+        return Usage(
+            total_tokens=self.total_tokens,
+            prompt_tokens=self.prompt_tokens,
+            completion_tokens=self.completion_tokens,
+            total_cost_usd=self.total_cost_usd,
+            calls=self.calls,
+        )
+
+    def snapshot(self) -> UsageTuple:
+        """Return an immutable point-in-time view of this Usage.
+
+        Returns:
+            UsageTuple with the current values.
+        """
+        return UsageTuple(
+            total_tokens=self.total_tokens,
+            prompt_tokens=self.prompt_tokens,
+            completion_tokens=self.completion_tokens,
+            total_cost_usd=self.total_cost_usd,
+            calls=self.calls,
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the usage fields as a plain dictionary.
+
+        Returns:
+            Dictionary of field names to values.
+        """
+        return {
+            "total_tokens": self.total_tokens,
+            "prompt_tokens": self.prompt_tokens,
+            "completion_tokens": self.completion_tokens,
+            "total_cost_usd": self.total_cost_usd,
+            "calls": self.calls,
+        }
+
+    def __repr__(self) -> str:
+        return (
+            f"Usage(total_tokens={self.total_tokens}, "
+            f"prompt_tokens={self.prompt_tokens}, "
+            f"completion_tokens={self.completion_tokens}, "
+            f"total_cost_usd={self.total_cost_usd}, "
+            f"calls={self.calls})"
+        )
+
 
-@dataclass
 class CacheStats:
     """Cache statistics.
 
@@ -52,10 +155,19 @@ class CacheStats:
         saved_tokens: Total tokens saved by cache.
     """
 
-    hits: int = 0
-    misses: int = 0
-    saved_cost_usd: float = 0.0
-    saved_tokens: int = 0
+    __slots__ = ("hits", "misses", "saved_cost_usd", "saved_tokens")
+
+    def __init__(
+        self,
+        hits: int = 0,
+        misses: int = 0,
+        saved_cost_usd: float = 0.0,
+        saved_tokens: int = 0,
+    ) -> None:
+        self.hits = hits
+        self.misses = misses
+        self.saved_cost_usd = saved_cost_usd
+        self.saved_tokens = saved_tokens
 
 
 class TokenTracker:
@@ -69,40 +181,70 @@ class TokenTracker:
         cache_stats: Cache statistics (if caching is enabled).
     """
 
-    def __init__(self, cache: Optional[str] = None) -> None:
+    def __init__(self, cache: Optional[str] = None, thread_safe: bool = True) -> None:
         """Initialize the token tracker.
 
         Args:
-            cache: Cache backend ("memory", "disk", None). Default: None.
+            cache: Cache backend ("memory", "disk", "sqlite", None). Default: None.
+            thread_safe: Guard counters with real locks. Pass False for
+                single-threaded use to drop the per-call lock overhead;
+                concurrent access to such a tracker may lose updates.
+                Default: True.
         """
         self._usage = Usage()
-        self._usage_by_provider: Dict[str, Usage] = {}
+        self._usage_by_provider: dict[str, Usage] = {}
+        # Read-only live view handed out by the usage_by_provider property;
+        # built once since MappingProxyType tracks the underlying dict.
+        self._usage_by_provider_view = MappingProxyType(self._usage_by_provider)
         self._cache_stats = CacheStats()
-        self._lock = threading.Lock()
+        # Usage counters and cache statistics are updated by different
+        # events (tracked calls vs cache hits/misses), so they get separate
+        # locks: recording a cache hit never contends with track().
+        if thread_safe:
+            self._lock: Any = threading.Lock()
+            self._stats_lock: Any = threading.Lock()
+        else:
+            self._lock = _NullLock()
+            self._stats_lock = _NullLock()
         self._cache: Optional[Cache] = None
-
-        if cache == "memory":
-            from .cache import MemoryCache
-
-            self._cache = MemoryCache()
-        elif cache == "disk":
-            from .cache import DiskCache
-
-            self._cache = DiskCache()
-        elif cache is not None:
-            raise ValueError(f"Unknown cache backend: {cache}. Use 'memory' or 'disk'.")
+        # Per-tracker resolved-price cache: hot models cost one local dict
+        # probe in track() instead of a cross-module pricing lookup. The
+        # version stamp detects register_model/refresh_pricing changes.
+        self._price_cache: dict[str, Any] = {}
+        self._price_version = _pricing._price_version
+        # Sorted provider names, computed lazily and invalidated when a
+        # provider first appears or the tracker resets. Reports reuse it
+        # instead of re-sorting per export.
+        self._providers_sorted: Optional[list[str]] = None
+        # Currently entered BudgetContext bound to this tracker, if any.
+        # Maintained by BudgetContext.__enter__/__exit__ so wrappers can
+        # check limits without a ContextVar lookup per response.
+        self._active_budget: Optional[Any] = None
+
+        if cache is not None:
+            try:
+                backend = _BACKENDS[cache]
+            except KeyError:
+                raise ValueError(
+                    f"Unknown cache backend: {cache}. Use 'memory', 'disk' or 'sqlite'."
+                ) from None
+            self._cache = backend()
 
     @property
     def usage(self) -> Usage:
         """Get overall usage statistics."""
         with self._lock:
-            return self._usage.model_copy()
+            return self._usage.copy()
 
     @property
-    def usage_by_provider(self) -> Dict[str, Usage]:
-        """Get usage statistics by provider."""
-        with self._lock:
-            return {k: v.model_copy() for k, v in self._usage_by_provider.items()}
+    def usage_by_provider(self) -> "MappingProxyType[str, Usage]":
+        """Get usage statistics by provider.
+
+        Returns a read-only live view over the internal store rather than
+        a per-access deep copy; entries update as calls are tracked. Use
+        snapshot() when a point-in-time consistent picture is needed.
+        """
+        return self._usage_by_provider_view
 
     @property
     def total_cost_usd(self) -> float:
@@ -113,7 +255,7 @@ class TokenTracker:
     @property
     def cache_stats(self) -> CacheStats:
         """Get cache statistics."""
-        with self._lock:
+        with self._stats_lock:
             return CacheStats(
                 hits=self._cache_stats.hits,
                 misses=self._cache_stats.misses,
@@ -121,6 +263,45 @@ class TokenTracker:
                 saved_tokens=self._cache_stats.saved_tokens,
             )
 
+    def snapshot(self) -> TrackerSnapshot:
+        """Take a consistent snapshot of all tracking statistics.
+
+        One lock acquisition covers overall usage, per-provider usage and
+        cache statistics, which is what reports and exports need instead
+        of hitting three locked copying properties.
+
+        Returns:
+            TrackerSnapshot of (usage, by_provider, cache_stats) tuples.
+        """
+        with self._lock:
+            usage = self._usage.snapshot()
+            by_provider = {p: u.snapshot() for p, u in self._usage_by_provider.items()}
+        with self._stats_lock:
+            stats = self._cache_stats
+            cache_stats = CacheStatsTuple(
+                hits=stats.hits,
+                misses=stats.misses,
+                saved_cost_usd=stats.saved_cost_usd,
+                saved_tokens=stats.saved_tokens,
+            )
+        return TrackerSnapshot(usage=usage, by_provider=by_provider, cache_stats=cache_stats)
+
+    def sorted_providers(self) -> list[str]:
+        """Get provider names in sorted order.
+
+        Cached until a new provider appears or the tracker is reset, so
+        generating several reports back to back sorts once.
+
+        Returns:
+            Sorted list of provider names.
+        """
+        names = self._providers_sorted
+        if names is None:
+            with self._lock:
+                names = sorted(self._usage_by_provider)
+            self._providers_sorted = names
+        return names
+
     def track(
         self,
         model: str,
@@ -137,21 +318,90 @@ class TokenTracker:
             provider: Provider name.
         """
         total_tokens = prompt_tokens + completion_tokens
-        cost = calculate_cost(model, prompt_tokens, completion_tokens)
-
-        usage = Usage(
-            total_tokens=total_tokens,
-            prompt_tokens=prompt_tokens,
-            completion_tokens=completion_tokens,
-            total_cost_usd=cost,
-            calls=1,
+        # Resolve the price locally; the version check (one int compare)
+        # drops the cache when a pricing tier has changed underneath us.
+        if self._price_version != _pricing._price_version:
+            self._price_cache.clear()
+            self._price_version = _pricing._price_version
+        price = self._price_cache.get(model)
+        if price is None:
+            price = self._price_cache[model] = get_price(model)
+        cost = (
+            prompt_tokens * price._input_per_token
+            + completion_tokens * price._output_per_token
         )
 
+        # Fold the increments straight into the running totals rather than
+        # building an intermediate Usage per call.
         with self._lock:
-            self._usage.add(usage)
-            if provider not in self._usage_by_provider:
-                self._usage_by_provider[provider] = Usage()
-            self._usage_by_provider[provider].add(usage)
+            usage = self._usage
+            usage.total_tokens += total_tokens
+            usage.prompt_tokens += prompt_tokens
+            usage.completion_tokens += completion_tokens
+            usage.total_cost_usd += cost
+            usage.calls += 1
+
+            # Single probe: .get() plus an assignment on first sight of a
+            # provider, instead of a membership test and a second lookup.
+            entry = self._usage_by_provider.get(provider)
+            if entry is None:
+                entry = self._usage_by_provider[provider] = Usage()
+                self._providers_sorted = None
+            entry.total_tokens += total_tokens
+            entry.prompt_tokens += prompt_tokens
+            entry.completion_tokens += completion_tokens
+            entry.total_cost_usd += cost
+            entry.calls += 1
+
+    def track_many(self, records: "list[tuple[str, int, int, str]]") -> None:
+        """Track a batch of API calls under one lock acquisition.
+
+        Useful for results of batch APIs or offline logs, where calling
+        track() per record would pay a lock acquire/release each time.
+        Costs and per-provider aggregates are computed outside the lock;
+        only the final fold is serialized.
+
+        Args:
+            records: Sequence of (model, prompt_tokens, completion_tokens,
+                provider) tuples.
+        """
+        if not records:
+            return
+
+        if self._price_version != _pricing._price_version:
+            self._price_cache.clear()
+            self._price_version = _pricing._price_version
+        price_cache = self._price_cache
+
+        aggregates: dict[str, Usage] = {}
+        for model, prompt_tokens, completion_tokens, provider in records:
+            # Same per-tracker price resolution as track(): one local dict
+            # probe per record after the first sighting of a model.
+            price = price_cache.get(model)
+            if price is None:
+                price = price_cache[model] = get_price(model)
+            cost = (
+                prompt_tokens * price._input_per_token
+                + completion_tokens * price._output_per_token
+            )
+            agg = aggregates.get(provider)
+            if agg is None:
+                agg = aggregates[provider] = Usage()
+            agg.total_tokens += prompt_tokens + completion_tokens
+            agg.prompt_tokens += prompt_tokens
+            agg.completion_tokens += completion_tokens
+            agg.total_cost_usd += cost
+            agg.calls += 1
+
+        with self._lock:
+            for provider, agg in aggregates.items():
+                self._usage.add(agg)
+                entry = self._usage_by_provider.get(provider)
+                if entry is None:
+                    self._usage_by_provider[provider] = agg
+                    self._providers_sorted = None
+                else:
+                    entry.add(agg)
 
     def record_cache_hit(self, saved_tokens: int, saved_cost: float) -> None:
         """Record a cache hit.
@@ -160,14 +410,14 @@ class TokenTracker:
             saved_tokens: Number of tokens saved.
             saved_cost: Cost saved in USD.
         """
-        with self._lock:
+        with self._stats_lock:
             self._cache_stats.hits += 1
             self._cache_stats.saved_tokens += saved_tokens
             self._cache_stats.saved_cost_usd += saved_cost
 
     def record_cache_miss(self) -> None:
         """Record a cache miss."""
-        with self._lock:
+        with self._stats_lock:
             self._cache_stats.misses += 1
 
     def reset(self) -> None:
@@ -175,6 +425,9 @@ class TokenTracker:
         with self._lock:
             self._usage = Usage()
             self._usage_by_provider.clear()
+            self._providers_sorted = None
+            self._price_cache.clear()
+        with self._stats_lock:
             self._cache_stats = CacheStats()
 
     def wrap_openai(self, client: Any) -> Any:
@@ -4,19 +4,53 @@ import hashlib
 import json
 from typing import Any, Dict
 
+try:
+    import orjson
 
-def hash_request(data: Dict[str, Any]) -> str:
+    def _canonical_dumps(data: Any) -> bytes:
+        """Serialize data to canonical bytes via orjson (C-level, fast)."""
+        return orjson.dumps(data, option=orjson.OPT_SORT_KEYS, default=str)
+
+except ImportError:
+
+    def _canonical_dumps(data: Any) -> bytes:
+        """Serialize data to canonical bytes via the stdlib json module."""
+        return json.dumps(data, sort_keys=True, default=str).encode()
+
+
+try:
+    import xxhash
+
+    def _digest(data: bytes) -> bytes:
+        """Hash bytes with xxh3 (non-cryptographic, much faster than SHA)."""
+        return bytes(xxhash.xxh3_128(data).digest())
+
+except ImportError:
+
+    def _digest(data: bytes) -> bytes:
+        """Hash bytes with BLAKE2b from the stdlib.
+
+        Notably faster than SHA-256 on CPython, and 16 bytes is plenty
+        for a non-adversarial cache key.
+        """
+        return hashlib.blake2b(data, digest_size=16).digest()
+
+
+def hash_request(data: Dict[str, Any]) -> bytes:
     """Generate a stable hash for a request.
 
+    Cache keys are not adversarial, so when the optional accelerators are
+    installed (pip install tokenbudget[cache]) the request is serialized
+    with orjson and hashed with xxh3 instead of json + SHA-256.
+
     Args:
         data: Request data to hash.
 
     Returns:
-        SHA256 hash of the request data.
+        Raw digest of the canonicalized request data. Bytes hash and
+        compare faster than a hex string twice their length.
     """
-    # Sort keys for consistent hashing
-    serialized = json.dumps(data, sort_keys=True, default=str)
-    return hashlib.sha256(serialized.encode()).hexdigest()
+    return _digest(_canonical_dumps(data))
 
 
 def format_cost(cost_usd: float) -> str:
@@ -28,9 +62,9 @@ def format_cost(cost_usd: float) -> str:
     Returns:
         Formatted cost string (e.g., "$0.0025" or "$1.50").
     """
-    if cost_usd < 0.01:
-        return f"${cost_usd:.4f}"
-    return f"${cost_usd:.2f}"
+    if cost_usd >= 0.01:
+        return f"${cost_usd:.2f}"
+    return f"${cost_usd:.4f}"
 
 
 def format_number(num: int) -> str:
@@ -42,8 +76,11 @@ def format_number(num: int) -> str:
     Returns:
         Formatted number string (e.g., "1.2k" or "3.4M").
     """
-    if num >= 1_000_000:
-        return f"{num / 1_000_000:.1f}M"
-    if num >= 1_000:
-        return f"{num / 1_000:.1f}k"
-    return str(num)
+    # Most values (per-provider call counts) are small: test that first,
+    # and scale by reciprocal multiplication, which is cheaper than float
+    # division on CPython.
+    if num < 1_000:
+        return str(num)
+    if num < 1_000_000:
+        return f"{num * 1e-3:.1f}k"
+    return f"{num * 1e-6:.1f}M"
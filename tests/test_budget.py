@@ -90,6 +90,20 @@ def test_remaining_budget():
         assert ctx.remaining_tokens == 850  # 1000 - 150
 
 
+def test_nested_budget_contexts():
+    """Test that exiting an inner budget restores the outer one."""
+    from tokenbudget import get_current_budget
+
+    tracker = TokenTracker()
+
+    with budget(max_cost_usd=1.0, tracker=tracker) as outer:
+        with budget(max_cost_usd=0.5, tracker=tracker) as inner:
+            assert get_current_budget() is inner
+        assert get_current_budget() is outer
+
+    assert get_current_budget() is None
+
+
 def test_no_limits():
     """Test budget with no limits."""
     tracker = TokenTracker()
@@ -5,7 +5,7 @@ from pathlib import Path
 
 import pytest
 
-from tokenbudget.cache import DiskCache, MemoryCache
+from tokenbudget.cache import DiskCache, MemoryCache, SQLiteCache, TieredCache
 
 
 def test_memory_cache():
@@ -45,6 +45,71 @@ def test_disk_cache():
         assert cache.get("key1") is None
 
 
+def test_disk_cache_no_temp_file_leak():
+    """Test that failed writes don't leak temp files and clear() sweeps them."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        cache = DiskCache(cache_dir=tmpdir)
+
+        # A value that fails serialization must not leave a .tmp-* file
+        class Unserializable:
+            def __reduce__(self):
+                raise RuntimeError("cannot serialize")
+
+        cache.set("bad", Unserializable())
+        assert not [p for p in Path(tmpdir).iterdir() if p.name.startswith(".tmp-")]
+
+        # clear() removes temp files orphaned by interrupted writes
+        (Path(tmpdir) / ".tmp-orphan").touch()
+        cache.set("key1", "value1")
+        cache.clear()
+        assert list(Path(tmpdir).iterdir()) == []
+
+
+def test_sqlite_cache():
+    """Test SQLite-backed cache."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db_path = str(Path(tmpdir) / "cache.db")
+        cache = SQLiteCache(db_path=db_path)
+
+        # Test set and get
+        cache.set("key1", {"data": "value1"})
+        assert cache.get("key1") == {"data": "value1"}
+
+        # Test missing key
+        assert cache.get("nonexistent") is None
+
+        # Test persistence (create new cache instance)
+        cache2 = SQLiteCache(db_path=db_path)
+        assert cache2.get("key1") == {"data": "value1"}
+
+        # Test clear
+        cache.clear()
+        assert cache.get("key1") is None
+
+
+def test_tiered_cache():
+    """Test LRU layer over a disk backend."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        cache = TieredCache(DiskCache(cache_dir=tmpdir), max_entries=2)
+
+        # Write-through: value lands in both layers
+        cache.set("key1", "value1")
+        assert cache.get("key1") == "value1"
+
+        # Backend-only value is promoted into the memory layer on read
+        cache2 = TieredCache(DiskCache(cache_dir=tmpdir))
+        assert cache2.get("key1") == "value1"
+
+        # Eviction keeps the LRU bounded but the backend intact
+        cache.set("key2", "value2")
+        cache.set("key3", "value3")
+        assert cache.get("key1") == "value1"
+
+        # Clear empties both layers
+        cache.clear()
+        assert cache.get("key1") is None
+
+
 def test_cache_key_generation():
     """Test cache key generation."""
     cache = MemoryCache()
@@ -21,7 +21,13 @@ from tokenbudget import (
     export_json,
     ModelNotFoundError,
 )
-from tokenbudget.pricing import _CUSTOM_DB, _LITELLM_DB, ModelPrice
+from tokenbudget.pricing import (
+    _CUSTOM_DB,
+    _LITELLM_DB,
+    ModelPrice,
+    _rebuild_provider_index,
+    _resolve_price,
+)
 
 
 @pytest.fixture(autouse=True)
@@ -29,9 +35,15 @@ def _clean_state():
     """Ensure custom and LiteLLM dicts are clean between tests."""
     _CUSTOM_DB.clear()
     _LITELLM_DB.clear()
+    _rebuild_provider_index()
+    _resolve_price.cache_clear()
+    calculate_cost.cache_clear()
     yield
     _CUSTOM_DB.clear()
     _LITELLM_DB.clear()
+    _rebuild_provider_index()
+    _resolve_price.cache_clear()
+    calculate_cost.cache_clear()
 
 
 # ── Live pricing refresh ────────────────────────────────────────────────────
@@ -10,7 +10,13 @@ from tokenbudget import (
     refresh_pricing,
     register_model,
 )
-from tokenbudget.pricing import _CUSTOM_DB, _LITELLM_DB, ModelPrice
+from tokenbudget.pricing import (
+    _CUSTOM_DB,
+    _LITELLM_DB,
+    ModelPrice,
+    _rebuild_provider_index,
+    _resolve_price,
+)
 
 
 @pytest.fixture(autouse=True)
@@ -18,9 +24,15 @@ def _clean_pricing_state():
     """Ensure custom and LiteLLM dicts are clean between tests."""
     _CUSTOM_DB.clear()
     _LITELLM_DB.clear()
+    _rebuild_provider_index()
+    _resolve_price.cache_clear()
+    calculate_cost.cache_clear()
     yield
     _CUSTOM_DB.clear()
     _LITELLM_DB.clear()
+    _rebuild_provider_index()
+    _resolve_price.cache_clear()
+    calculate_cost.cache_clear()
 
 
 # ── Existing tests (preserved) ──────────────────────────────────────────────
@@ -80,6 +92,21 @@ def test_calculate_cost():
     assert cost2 > cost1
 
 
+def test_calculate_cost_batch():
+    """Test batch cost calculation matches per-call results."""
+    from tokenbudget import calculate_cost_batch
+
+    models = ["gpt-4o", "claude-sonnet-4-5", "gpt-4o"]
+    input_tokens = [1000, 500, 250]
+    output_tokens = [500, 250, 125]
+
+    costs = calculate_cost_batch(models, input_tokens, output_tokens)
+
+    assert len(costs) == 3
+    for cost, model, itok, otok in zip(costs, models, input_tokens, output_tokens):
+        assert cost == pytest.approx(calculate_cost(model, itok, otok))
+
+
 def test_all_major_models_present():
     """Test that all major models are in the pricing database."""
     major_models = [
@@ -144,6 +171,20 @@ def test_litellm_only_model():
     assert price.provider == "openai"
 
 
+def test_packaged_snapshot_fallback():
+    """Test that snapshot-only models resolve offline, without refresh_pricing."""
+    # Neither model is in the hardcoded tier, and the autouse fixture
+    # guarantees the custom and LiteLLM tiers are empty, so these can
+    # only resolve through the packaged snapshot.
+    price = get_price("o3")
+    assert price.provider == "openai"
+    assert price.input_per_1k > 0
+
+    price = get_price("gemini-3-pro-preview")
+    assert price.input_per_1k > 0
+    assert price.output_per_1k > 0
+
+
 def test_list_models_merges_all_tiers():
     """Test that list_models returns merged view across all tiers."""
     _LITELLM_DB["litellm-only-model"] = ModelPrice(
@@ -268,3 +309,17 @@ def test_refresh_pricing_with_bad_url():
     # Hardcoded pricing should still work
     price = get_price("gpt-4o")
     assert price.provider == "openai"
+
+
+def test_model_price_pickle_and_copy():
+    """Test that ModelPrice survives pickle and the copy module."""
+    import copy
+    import pickle
+
+    price = ModelPrice(input_per_1k=0.003, output_per_1k=0.015, provider="anthropic")
+
+    for clone in (pickle.loads(pickle.dumps(price)), copy.copy(price), copy.deepcopy(price)):
+        assert clone == price
+        # Derived per-token rates are rebuilt by __post_init__
+        assert clone._input_per_token == price._input_per_token
+        assert clone._output_per_token == price._output_per_token
@@ -1,11 +1,31 @@
 """Tests for provider wrappers."""
 
-from unittest.mock import MagicMock, Mock
+from collections import namedtuple
+from types import SimpleNamespace
 
 import pytest
 
 from tokenbudget import TokenTracker
 
+# Plain namedtuple response shapes instead of nested Mock graphs: attribute
+# access is a C-level struct read, so wrapper overhead is what gets
+# measured, not Mock's dynamic __getattr__ machinery.
+FakeResponse = namedtuple("FakeResponse", "model usage")
+FakeOpenAIUsage = namedtuple("FakeOpenAIUsage", "prompt_tokens completion_tokens")
+FakeAnthropicUsage = namedtuple("FakeAnthropicUsage", "input_tokens output_tokens")
+
+
+class FakeEndpoint:
+    """Stand-in for an SDK endpoint exposing create()."""
+
+    def __init__(self, response):
+        self.response = response
+        self.calls = 0
+
+    def create(self, **kwargs):
+        self.calls += 1
+        return self.response
+
 
 def test_openai_wrapper():
     """Test OpenAI wrapper (requires openai package)."""
@@ -13,17 +33,15 @@ def test_openai_wrapper():
 
     from tokenbudget.providers.openai import OpenAIWrapper
 
-    # Create mock client
-    mock_client = Mock()
-    mock_response = Mock()
-    mock_response.model = "gpt-4o"
-    mock_response.usage = Mock(prompt_tokens=100, completion_tokens=50)
-
-    mock_client.chat.completions.create.return_value = mock_response
+    # Create fake client
+    fake_response = FakeResponse(model="gpt-4o", usage=FakeOpenAIUsage(100, 50))
+    fake_client = SimpleNamespace(
+        chat=SimpleNamespace(completions=FakeEndpoint(fake_response))
+    )
 
     # Wrap client
     tracker = TokenTracker()
-    wrapped_client = OpenAIWrapper(mock_client, tracker)
+    wrapped_client = OpenAIWrapper(fake_client, tracker)
 
     # Make a call
     response = wrapped_client.chat.completions.create(
@@ -42,17 +60,15 @@ def test_anthropic_wrapper():
 
     from tokenbudget.providers.anthropic import AnthropicWrapper
 
-    # Create mock client
-    mock_client = Mock()
-    mock_response = Mock()
-    mock_response.model = "claude-sonnet-4-5"
-    mock_response.usage = Mock(input_tokens=100, output_tokens=50)
-
-    mock_client.messages.create.return_value = mock_response
+    # Create fake client
+    fake_response = FakeResponse(
+        model="claude-sonnet-4-5", usage=FakeAnthropicUsage(100, 50)
+    )
+    fake_client = SimpleNamespace(messages=FakeEndpoint(fake_response))
 
     # Wrap client
     tracker = TokenTracker()
-    wrapped_client = AnthropicWrapper(mock_client, tracker)
+    wrapped_client = AnthropicWrapper(fake_client, tracker)
 
     # Make a call
     response = wrapped_client.messages.create(
@@ -56,6 +56,34 @@ def test_multiple_providers():
     assert usage_by_provider["anthropic"].total_tokens == 300
 
 
+def test_track_many():
+    """Test batch tracking matches per-call tracking."""
+    tracker = TokenTracker()
+    tracker.track_many(
+        [
+            ("gpt-4o", 100, 50, "openai"),
+            ("gpt-4o", 200, 100, "openai"),
+            ("claude-sonnet-4-5", 300, 150, "anthropic"),
+        ]
+    )
+
+    reference = TokenTracker()
+    reference.track(model="gpt-4o", prompt_tokens=100, completion_tokens=50, provider="openai")
+    reference.track(model="gpt-4o", prompt_tokens=200, completion_tokens=100, provider="openai")
+    reference.track(
+        model="claude-sonnet-4-5",
+        prompt_tokens=300,
+        completion_tokens=150,
+        provider="anthropic",
+    )
+
+    assert tracker.usage.total_tokens == reference.usage.total_tokens
+    assert tracker.usage.calls == reference.usage.calls
+    assert tracker.usage.total_cost_usd == pytest.approx(reference.usage.total_cost_usd)
+    assert tracker.usage_by_provider["openai"].calls == 2
+    assert tracker.usage_by_provider["anthropic"].total_tokens == 450
+
+
 def test_cache_stats():
     """Test cache statistics tracking."""
     tracker = TokenTracker()
@@ -103,3 +131,17 @@ def test_thread_safety():
     # Should have 1000 total calls (10 threads * 100 calls)
     assert tracker.usage.calls == 1000
     assert tracker.usage.total_tokens == 15000
+
+
+def test_thread_safe_false():
+    """Test tracking with locking disabled for single-threaded use."""
+    tracker = TokenTracker(thread_safe=False)
+
+    tracker.track(model="gpt-4o", prompt_tokens=100, completion_tokens=50, provider="openai")
+    tracker.record_cache_hit(saved_tokens=50, saved_cost=0.005)
+
+    assert tracker.usage.total_tokens == 150
+    assert tracker.cache_stats.hits == 1
+
+    tracker.reset()
+    assert tracker.usage.calls == 0